@@ -1,53 +1,35 @@
+import argparse
 import json
+from pathlib import Path
 from typing import List
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
 import pandas as pd
-import os
 from parse_eval_json import load_eval_items
 
-# Ensure charts directory exists
-CHARTS_DIR = os.path.join(os.path.dirname(__file__), "../charts")
-os.makedirs(CHARTS_DIR, exist_ok=True)
-
-# Load data
-EVAL_PATH = os.path.join(os.path.dirname(__file__), "../eval/eval.json")
-items = load_eval_items(EVAL_PATH)
+# Resolve project paths once; Path arithmetic avoids repeated dirname/join calls
+ROOT = Path(__file__).resolve().parent.parent
 
+# Ensure charts directory exists
+CHARTS_DIR = ROOT / "charts"
+CHARTS_DIR.mkdir(exist_ok=True)
 
-# Extract scores for each criterion
-def extract_scores(items: List) -> pd.DataFrame:
-    records = []
-    for item in items:
-        for system in ["baseline", "proposed"]:
-            scores = getattr(item.evaluation.arguments, f"{system}_scores")
-            records.append(
-                {
-                    "index": item.index,
-                    "system": system,
-                    "clarity_structure": scores.clarity_structure.score,
-                    "completeness": scores.completeness.score,
-                    "technical_accuracy": scores.technical_accuracy.score,
-                    "depth": scores.depth.score,
-                    "readability": scores.readability.score,
-                    "examples": scores.examples.score,
-                    "references": scores.references.score,
-                    "summary_takeaway": scores.summary_takeaway.score,
-                    "average_score": scores.average_score,
-                }
-            )
-    return pd.DataFrame(records)
-
+parser = argparse.ArgumentParser(description="Analyze eval results and render charts.")
+parser.add_argument(
+    "--csv",
+    action="store_true",
+    help="Also write results as CSV (default output is Feather, which is faster to read/write).",
+)
+args = parser.parse_args()
 
-df = extract_scores(items)
+# Load data
+EVAL_PATH = ROOT / "eval" / "eval.json"
+items = load_eval_items(str(EVAL_PATH))
 
-# Output DataFrame to CSV
-csv_path = os.path.join(CHARTS_DIR, "eval_results.csv")
-df.to_csv(csv_path, index=False)
-print(f"Eval results saved to CSV: {csv_path}")
 
-# List of basic criteria (exclude average_score)
-basic_criteria = [
+# Score criteria extracted from each ResponseScores object (order matters)
+SCORE_FIELDS = [
     "clarity_structure",
     "completeness",
     "technical_accuracy",
@@ -58,11 +40,105 @@ basic_criteria = [
     "summary_takeaway",
 ]
 
-# Calculate mean for each criterion by system and output to CSV
-mean_df = df.groupby("system")[basic_criteria + ["average_score"]].mean().reset_index()
-mean_csv_path = os.path.join(CHARTS_DIR, "eval_results_mean.csv")
-mean_df.to_csv(mean_csv_path, index=False)
-print(f"Mean eval results (per system) saved to CSV: {mean_csv_path}")
+SYSTEMS = ["baseline", "proposed"]
+
+
+# Extract scores for each criterion
+def extract_scores(items: List) -> pd.DataFrame:
+    # Pull all scores into one contiguous float32 array (items x systems rows,
+    # criteria + average_score columns) instead of building per-row dicts.
+    n_cols = len(SCORE_FIELDS) + 1
+    scores = np.fromiter(
+        (
+            value
+            for item in items
+            for system in SYSTEMS
+            for value in (
+                *(
+                    getattr(
+                        getattr(item.evaluation.arguments, f"{system}_scores"), field
+                    ).score
+                    for field in SCORE_FIELDS
+                ),
+                getattr(item.evaluation.arguments, f"{system}_scores").average_score,
+            )
+        ),
+        dtype=np.float32,
+        count=len(items) * len(SYSTEMS) * n_cols,
+    ).reshape(-1, n_cols)
+    columns = {
+        "index": np.repeat(np.fromiter((item.index for item in items), dtype=np.int64), 2),
+        "system": np.tile(np.array(SYSTEMS, dtype=object), len(items)),
+    }
+    for col, field in enumerate(SCORE_FIELDS + ["average_score"]):
+        columns[field] = scores[:, col]
+    return pd.DataFrame(columns)
+
+
+df = extract_scores(items)
+
+def write_csv(df: pd.DataFrame) -> None:
+    # The frame is numeric apart from 'system'; encode it as an int code
+    # (0=baseline, 1=proposed) and write with np.savetxt, which is much
+    # faster than DataFrame.to_csv for numeric data.
+    csv_path = str(CHARTS_DIR / "eval_results.csv")
+    system_codes = df["system"].map({"baseline": 0, "proposed": 1}).to_numpy(np.int8)
+    mat = np.column_stack(
+        [
+            df["index"].to_numpy(np.int64),
+            system_codes,
+            df[SCORE_FIELDS + ["average_score"]].to_numpy(np.float32),
+        ]
+    )
+    header = ",".join(["index", "system"] + SCORE_FIELDS + ["average_score"]) + "\n"
+    with open(csv_path, "wb") as f:
+        f.write(header.encode())
+        np.savetxt(f, mat, fmt="%d,%d" + ",%.3f" * (len(SCORE_FIELDS) + 1))
+    print(f"Eval results saved to CSV: {csv_path}")
+
+
+# Output DataFrame to Feather (columnar, no per-cell stringification like
+# CSV); pandas needs pyarrow for it, which is optional here, so fall back to
+# the CSV writer when it is missing rather than dying before any output.
+try:
+    feather_path = str(CHARTS_DIR / "eval_results.feather")
+    df.to_feather(feather_path)
+    print(f"Eval results saved to Feather: {feather_path}")
+except ImportError:
+    print("pyarrow not installed; saving eval results as CSV instead")
+    write_csv(df)
+else:
+    if args.csv:
+        write_csv(df)
+
+# List of basic criteria (exclude average_score)
+basic_criteria = SCORE_FIELDS
+
+# Aggregate mean/std for every criterion by system in a single groupby pass;
+# the mean table, the average-score bars and their annotations all reuse it.
+group_stats = df.groupby("system")[basic_criteria + ["average_score"]].agg(
+    ["mean", "std"]
+)
+mean_df = group_stats.xs("mean", level=1, axis=1).reset_index()
+
+
+def write_mean_csv(mean_df: pd.DataFrame) -> None:
+    mean_csv_path = str(CHARTS_DIR / "eval_results_mean.csv")
+    mean_df.to_csv(mean_csv_path, index=False)
+    print(f"Mean eval results (per system) saved to CSV: {mean_csv_path}")
+
+
+# Same optional-pyarrow guard as the per-item frame above.
+try:
+    mean_feather_path = str(CHARTS_DIR / "eval_results_mean.feather")
+    mean_df.to_feather(mean_feather_path)
+    print(f"Mean eval results (per system) saved to Feather: {mean_feather_path}")
+except ImportError:
+    print("pyarrow not installed; saving mean eval results as CSV instead")
+    write_mean_csv(mean_df)
+else:
+    if args.csv:
+        write_mean_csv(mean_df)
 
 # Set style
 sns.set(style="whitegrid", font_scale=1.1)
@@ -74,16 +150,29 @@ df_melt = df.melt(
     var_name="criterion",
     value_name="score",
 )
-plt.figure(figsize=(12, 6))
-sns.barplot(
-    data=df_melt,
-    x="criterion",
-    y="score",
-    hue="system",
-    ci="sd",
-    palette="muted",
-    capsize=0.1,
+# Precompute mean/std per (criterion, system) once instead of letting
+# seaborn bootstrap the error bars on every draw.
+criteria_stats = (
+    df_melt.groupby(["criterion", "system"])["score"]
+    .agg(["mean", "std"])
+    .unstack("system")
 )
+palette = sns.color_palette("muted", len(SYSTEMS))
+x = np.arange(len(basic_criteria))
+plt.figure(figsize=(12, 6))
+ax = plt.gca()
+for offset, system, color in zip((-0.2, 0.2), SYSTEMS, palette):
+    ax.bar(
+        x + offset,
+        criteria_stats["mean"][system].reindex(basic_criteria),
+        width=0.4,
+        yerr=criteria_stats["std"][system].reindex(basic_criteria),
+        capsize=4,
+        label=system,
+        color=color,
+    )
+ax.set_xticks(x)
+ax.set_xticklabels(basic_criteria)
 plt.title("Comparison of Baseline vs Proposed System Across Evaluation Criteria")
 plt.ylabel("Score")
 plt.xlabel("Evaluation Criterion")
@@ -91,16 +180,24 @@ plt.ylim(0, 10)
 plt.xticks(rotation=25)
 plt.legend(title="System")
 plt.tight_layout()
-plt.savefig(os.path.join(CHARTS_DIR, "comparison_grouped_criteria.png"))
+plt.savefig(str(CHARTS_DIR / "comparison_grouped_criteria.png"))
 plt.close()
 
 # --- Average score: barplot with annotation, and boxplot for distribution ---
+avg_stats = group_stats["average_score"]
 plt.figure(figsize=(7, 5))
-ax = sns.barplot(
-    data=df, x="system", y="average_score", ci="sd", palette="muted", capsize=0.1
+ax = plt.gca()
+ax.bar(
+    np.arange(len(avg_stats)),
+    avg_stats["mean"],
+    yerr=avg_stats["std"],
+    capsize=4,
+    color=palette,
 )
+ax.set_xticks(np.arange(len(avg_stats)))
+ax.set_xticklabels(avg_stats.index)
 # Annotate mean values on bars
-means = df.groupby("system")["average_score"].mean()
+means = avg_stats["mean"]
 for i, system in enumerate(means.index):
     mean_val = means[system]
     ax.text(
@@ -117,7 +214,7 @@ plt.ylabel("Average Score")
 plt.ylim(0, 10)
 plt.xlabel("System")
 plt.tight_layout()
-plt.savefig(os.path.join(CHARTS_DIR, "average_score_barplot.png"))
+plt.savefig(str(CHARTS_DIR / "average_score_barplot.png"))
 plt.close()
 
 # Boxplot for average score distribution
@@ -135,13 +232,16 @@ sns.boxplot(
         "markersize": "8",
     },
 )
-sns.swarmplot(data=df, x="system", y="average_score", color="k", alpha=0.5, size=4)
+# stripplot lays points out in O(N); swarmplot's overlap avoidance is O(N^2)
+sns.stripplot(
+    data=df, x="system", y="average_score", color="k", alpha=0.5, size=3, jitter=0.15
+)
 plt.title("Distribution of Average Scores by System")
 plt.ylabel("Average Score")
 plt.ylim(0, 10)
 plt.xlabel("System")
 plt.tight_layout()
-plt.savefig(os.path.join(CHARTS_DIR, "average_score_boxplot.png"))
+plt.savefig(str(CHARTS_DIR / "average_score_boxplot.png"))
 plt.close()
 
 print(f"Analysis complete. Charts saved in {CHARTS_DIR} directory.")
@@ -1,3 +1,4 @@
+import io
 import os
 import asyncio
 from lightrag import LightRAG
@@ -28,65 +29,96 @@ async def initialize_rag_instance():
     return rag
 
 
+# Số nhóm synonym được merge đồng thời
+MERGE_CONCURRENCY = int(os.getenv("MERGE_CONCURRENCY", "4"))
+
+
+def load_synonym_groups(path):
+    """Đọc mapping file thành danh sách các nhóm entity (mỗi dòng một nhóm)."""
+    groups = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            entities = [e.strip() for e in line.split(";") if e.strip()]
+            if entities:
+                groups.append(entities)
+    return groups
+
+
+async def process_group(rag, entities, sem):
+    # Log của mỗi nhóm được gom vào buffer riêng để output không bị xen kẽ
+    out = io.StringIO()
+    async with sem:
+        out.write(f"\n=== Entities in line: {entities} ===\n")
+        entity_goc = entities[0]
+        synonyms = entities[1:]
+        # Fetch từng entity đúng một lần, song song; kết quả được dùng
+        # lại cho cả bước in thông tin lẫn bước lọc synonym
+        results = await asyncio.gather(
+            *(rag.get_entity_info(e, include_vector_data=True) for e in entities),
+            return_exceptions=True,
+        )
+        infos = dict(zip(entities, results))
+        # In thông tin từng entity trước khi merge
+        for entity in entities:
+            info = infos[entity]
+            if isinstance(info, Exception):
+                out.write(f"Entity: {entity}\n")
+                out.write(f"Error fetching info: {info}\n\n")
+                continue
+            entity_name = info.get("entity_name", "")
+            description = ""
+            graph_data = info.get("graph_data", {})
+            if isinstance(graph_data, dict):
+                description = graph_data.get("description", "")
+            out.write(f"Entity: {entity_name}\n")
+            out.write(f"Description: {description}\n\n")
+        # Chỉ merge các synonym vào entity gốc
+        if synonyms:
+            # Lọc synonym thực sự tồn tại (tái dùng infos, không gọi lại)
+            valid_synonyms = [
+                s
+                for s in synonyms
+                if not isinstance(infos[s], Exception) and infos[s].get("graph_data")
+            ]
+            if not valid_synonyms:
+                out.write(f"No valid synonyms to merge for '{entity_goc}'. Skipping.\n")
+                return out.getvalue()
+            out.write(f"Merging {valid_synonyms} into '{entity_goc}' ...\n")
+            merge_strategy = {
+                "description": "concatenate",
+                "entity_type": "keep_first",
+                "source_id": "join_unique",
+            }
+            try:
+                result = await rag.amerge_entities(
+                    source_entities=valid_synonyms,
+                    target_entity=entity_goc,
+                    merge_strategy=merge_strategy,
+                )
+                out.write(f"Merge result for '{entity_goc}':\n")
+                out.write(f"{result}\n")
+            except Exception as e:
+                out.write(f"Error merging: {e}\n")
+    return out.getvalue()
+
+
 async def main():
     rag = await initialize_rag_instance()
     try:
         if not os.path.exists(MAPPING_FILE):
             print(f"Mapping file not found: {MAPPING_FILE}")
             return
-        with open(MAPPING_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                entities = [e.strip() for e in line.split(";") if e.strip()]
-                if not entities:
-                    continue
-                print(f"\n=== Entities in line: {entities} ===")
-                entity_goc = entities[0]
-                synonyms = entities[1:]
-                # In thông tin từng entity trước khi merge
-                for entity in entities:
-                    info = await rag.get_entity_info(entity, include_vector_data=True)
-                    entity_name = info.get("entity_name", "")
-                    description = ""
-                    graph_data = info.get("graph_data", {})
-                    if isinstance(graph_data, dict):
-                        description = graph_data.get("description", "")
-                    print(f"Entity: {entity_name}")
-                    print(f"Description: {description}\n")
-                # Chỉ merge các synonym vào entity gốc
-                if synonyms:
-                    # Lọc synonym thực sự tồn tại
-                    valid_synonyms = []
-                    for s in synonyms:
-                        try:
-                            info = await rag.get_entity_info(s)
-                            if info.get("graph_data"):
-                                valid_synonyms.append(s)
-                        except Exception:
-                            continue
-                    if not valid_synonyms:
-                        print(
-                            f"No valid synonyms to merge for '{entity_goc}'. Skipping."
-                        )
-                        continue
-                    print(f"Merging {valid_synonyms} into '{entity_goc}' ...")
-                    merge_strategy = {
-                        "description": "concatenate",
-                        "entity_type": "keep_first",
-                        "source_id": "join_unique",
-                    }
-                    try:
-                        result = await rag.amerge_entities(
-                            source_entities=valid_synonyms,
-                            target_entity=entity_goc,
-                            merge_strategy=merge_strategy,
-                        )
-                        print(f"Merge result for '{entity_goc}':")
-                        print(result)
-                    except Exception as e:
-                        print(f"Error merging: {e}")
+        groups = load_synonym_groups(MAPPING_FILE)
+        # Các nhóm độc lập nhau nên có thể merge song song (giới hạn bằng semaphore)
+        sem = asyncio.Semaphore(MERGE_CONCURRENCY)
+        logs = await asyncio.gather(
+            *(process_group(rag, group, sem) for group in groups)
+        )
+        for log in logs:
+            print(log, end="")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -1,9 +1,21 @@
 import os
 import json
-import time
-from openai import OpenAI
+import asyncio
+import hashlib
+import ijson
+from openai import AsyncOpenAI, RateLimitError
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
-client = OpenAI()
+client = AsyncOpenAI()
+
+# Number of evaluation requests in flight at once; the workload is
+# network-bound so concurrency is the main lever on wall time.
+EVAL_CONCURRENCY = int(os.getenv("EVAL_CONCURRENCY", "8"))
 
 function_schema = {
     "type": "function",
@@ -178,45 +190,43 @@ EVAL_PATH = "eval/eval.json"
 os.makedirs(os.path.dirname(EVAL_PATH), exist_ok=True)
 
 
-def load_jsonl(path):
+def iter_jsonl(path):
     if not os.path.exists(path):
-        return []
+        return
     with open(path, "r", encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
+        yield from (json.loads(line) for line in f if line.strip())
 
 
-def append_json_array(path, obj):
-    data = []
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except Exception:
-                data = []
-    data.append(obj)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def append_jsonl(path, obj):
+    # Appending one line per result is O(N) total I/O, unlike rewriting the
+    # whole JSON array on every save; load_jsonl is already the matching reader.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
         f.flush()
 
 
-def main():
-    with open(RESULTS_PATH, "r", encoding="utf-8") as f:
-        results = json.load(f)
-    done = load_jsonl(EVAL_PATH)
-    done_indices = set(item.get("index") for item in done if "index" in item)
+def content_hash(question, response_baseline, response_proposed):
+    # Content-addressed key so rerunning over an edited results.json only
+    # pays for triples that actually changed.
+    return hashlib.blake2b(
+        f"{question}\x1f{response_baseline}\x1f{response_proposed}".encode(),
+        digest_size=16,
+    ).hexdigest()
+
 
-    for idx, item in enumerate(results):
-        if idx in done_indices:
-            print(f"[SKIP] Item {idx} already evaluated.")
-            continue
-        question = item.get("question")
-        expected = item.get("expect_answer", "")
-        response_baseline = item.get("response_baseline")
-        response_proposed = item.get("response_proposed_system")
-        if not response_baseline or not response_proposed:
-            print(f"[SKIP] Item {idx} missing baseline/proposed response.")
-            continue
-        prompt = f"""
+async def eval_one(idx, item, sem, write_lock, done_hashes):
+    question = item.get("question")
+    expected = item.get("expect_answer", "")
+    response_baseline = item.get("response_baseline")
+    response_proposed = item.get("response_proposed_system")
+    if not response_baseline or not response_proposed:
+        print(f"[SKIP] Item {idx} missing baseline/proposed response.")
+        return
+    h = content_hash(question, response_baseline, response_proposed)
+    if h in done_hashes:
+        print(f"[SKIP] Item {idx} already evaluated (content hash match).")
+        return
+    prompt = f"""
 You MUST use the provided function tool to return your evaluation as structured JSON.
 You are an expert evaluator. Compare the two responses to the question below and return an evaluation in JSON using the function schema provided.
 
@@ -232,50 +242,82 @@ You are an expert evaluator. Compare the two responses to the question below and
 ### Proposed Response:
 {response_proposed}
 """
-        try:
-            response = client.responses.create(
-                model="gpt-4.1-mini",
-                input=[{"role": "user", "content": prompt}],
-                tools=[function_schema],
-                tool_choice={"type": "function", "name": "evaluate_responses"},
-                temperature=0.3,
-            )
-            if (
-                hasattr(response, "output")
-                and response.output
-                and len(response.output) > 0
+    try:
+        async with sem:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type(RateLimitError),
+                stop=stop_after_attempt(5),
+                wait=wait_exponential(multiplier=1, max=30),
+                reraise=True,
             ):
-                tool_call = response.output[0]
-                arguments = tool_call.arguments
-                try:
-                    arguments_dict = json.loads(arguments)
-                except Exception as e:
-                    print(f"[ERROR] Parse arguments failed for item {idx}: {e}")
-                    arguments_dict = arguments
-                structured_output = {
-                    "name": tool_call.name,
-                    "arguments": arguments_dict,
-                }
-            else:
-                print(f"[ERROR] Item {idx}: No function_call in response.")
-                print(f"Raw response: {response}")
-                continue
-            result = {
-                "index": idx,
-                "question": question,
-                "expected_answer": expected,
-                "baseline_response": response_baseline,
-                "proposed_response": response_proposed,
-                "evaluation": structured_output,
+                with attempt:
+                    response = await client.responses.create(
+                        model="gpt-4.1-mini",
+                        input=[{"role": "user", "content": prompt}],
+                        tools=[function_schema],
+                        tool_choice={"type": "function", "name": "evaluate_responses"},
+                        temperature=0.3,
+                    )
+        if hasattr(response, "output") and response.output and len(response.output) > 0:
+            tool_call = response.output[0]
+            arguments = tool_call.arguments
+            try:
+                arguments_dict = json.loads(arguments)
+            except Exception as e:
+                print(f"[ERROR] Parse arguments failed for item {idx}: {e}")
+                arguments_dict = arguments
+            structured_output = {
+                "name": tool_call.name,
+                "arguments": arguments_dict,
             }
-            append_json_array(EVAL_PATH, result)
-            print(f"[DONE] Item {idx} evaluated and saved.")
-            time.sleep(1)
-        except Exception as e:
-            print(f"[ERROR] Item {idx}: {e}")
-            print("You can rerun the script to resume.")
-            break
+        else:
+            print(f"[ERROR] Item {idx}: No function_call in response.")
+            print(f"Raw response: {response}")
+            return
+        result = {
+            "index": idx,
+            "hash": h,
+            "question": question,
+            "expected_answer": expected,
+            "baseline_response": response_baseline,
+            "proposed_response": response_proposed,
+            "evaluation": structured_output,
+        }
+        async with write_lock:
+            append_jsonl(EVAL_PATH, result)
+        print(f"[DONE] Item {idx} evaluated and saved.")
+    except Exception as e:
+        print(f"[ERROR] Item {idx}: {e}")
+        print("You can rerun the script to resume.")
+
+
+async def main():
+    done_indices = set()
+    done_hashes = set()
+    for item in iter_jsonl(EVAL_PATH):
+        if "index" in item:
+            done_indices.add(item["index"])
+        if "hash" in item:
+            done_hashes.add(item["hash"])
+    done_indices = frozenset(done_indices)
+    done_hashes = frozenset(done_hashes)
+
+    # Stream-parse results.json one object at a time; only items that still
+    # need evaluation are kept in memory.
+    pending = []
+    with open(RESULTS_PATH, "rb") as f:
+        for idx, item in enumerate(ijson.items(f, "item")):
+            if idx in done_indices:
+                print(f"[SKIP] Item {idx} already evaluated.")
+                continue
+            pending.append((idx, item))
+
+    sem = asyncio.Semaphore(EVAL_CONCURRENCY)
+    write_lock = asyncio.Lock()
+    await asyncio.gather(
+        *(eval_one(idx, item, sem, write_lock, done_hashes) for idx, item in pending)
+    )
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
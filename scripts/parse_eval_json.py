@@ -1,16 +1,17 @@
-from typing import List, Dict, Optional
-from pydantic import BaseModel
+from typing import Dict, List
 import json
 
+import msgspec
+
 
 # --- Score/comment pair for each aspect ---
-class ScoreComment(BaseModel):
+class ScoreComment(msgspec.Struct):
     score: float
     comment: str
 
 
 # --- Scores for a response (baseline or proposed) ---
-class ResponseScores(BaseModel):
+class ResponseScores(msgspec.Struct):
     clarity_structure: ScoreComment
     completeness: ScoreComment
     technical_accuracy: ScoreComment
@@ -23,14 +24,14 @@ class ResponseScores(BaseModel):
 
 
 # --- Verdict and recommendation ---
-class VerdictRecommendation(BaseModel):
+class VerdictRecommendation(msgspec.Struct):
     better_response: str
     justification: str
     recommendation: Dict[str, str]
 
 
 # --- Evaluation arguments ---
-class EvaluationArguments(BaseModel):
+class EvaluationArguments(msgspec.Struct):
     question: str
     expected_answer: str
     baseline_scores: ResponseScores
@@ -39,13 +40,13 @@ class EvaluationArguments(BaseModel):
 
 
 # --- Evaluation object ---
-class Evaluation(BaseModel):
+class Evaluation(msgspec.Struct):
     name: str
     arguments: EvaluationArguments
 
 
 # --- Main evaluation item ---
-class EvalItem(BaseModel):
+class EvalItem(msgspec.Struct):
     index: int
     question: str
     expected_answer: str
@@ -54,15 +55,24 @@ class EvalItem(BaseModel):
     evaluation: Evaluation
 
 
+# Decoders compiled once; msgspec parses and validates in C
+_decoder = msgspec.json.Decoder(List[EvalItem])
+_item_decoder = msgspec.json.Decoder(EvalItem)
+
+
 # --- Script to read and parse the file ---
 def load_eval_items(path: str) -> List[EvalItem]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return [EvalItem(**item) for item in data]
+    with open(path, "rb") as f:
+        data = f.read()
+    # eval_system now appends results as JSONL; older eval files are a
+    # single JSON array, so keep decoding those too.
+    if data.lstrip().startswith(b"["):
+        return _decoder.decode(data)
+    return [_item_decoder.decode(line) for line in data.splitlines() if line.strip()]
 
 
 if __name__ == "__main__":
     items = load_eval_items("eval/eval.json")
     print(f"Loaded {len(items)} evaluation items.")
     # Print the first item as an example
-    print(json.dumps(items[0].model_dump(), indent=2, ensure_ascii=False))
+    print(json.dumps(msgspec.to_builtins(items[0]), indent=2, ensure_ascii=False))
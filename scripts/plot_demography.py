@@ -1,98 +1,98 @@
+import matplotlib
+
+# Headless backend: tránh khởi tạo GUI backend khi chỉ render ra file
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import seaborn as sns
-import pandas as pd
 import os
 
 # Đảm bảo thư mục charts/ tồn tại
 os.makedirs("charts", exist_ok=True)
 
-# Dữ liệu domain of papers
-domain_data = {
-    "Domain": ["Math", "Physics", "Computer Science"],
-    "Number of Papers": [110, 140, 750],
-}
-df_domain = pd.DataFrame(domain_data)
+# Dữ liệu domain of papers — bảng hằng 3 dòng, dùng list trực tiếp
+# (không cần import/pandas DataFrame chỉ để vẽ; seaborn chỉ còn dùng cho palette)
+domains = ["Math", "Physics", "Computer Science"]
+domain_counts = [110, 140, 750]
 
 # Dữ liệu question type
-question_data = {
-    "Question Type": ["Definition", "Comparision", "Explanation", "Synthesis"],
-    "Number of Questions": [15, 12, 21, 12],
-}
-df_question = pd.DataFrame(question_data)
+question_types = ["Definition", "Comparision", "Explanation", "Synthesis"]
+question_counts = [15, 12, 21, 12]
+
+# Dùng lại một Figure duy nhất cho cả bốn biểu đồ (tránh tạo/huỷ figure
+# và warmup font cache nhiều lần); chỉ đổi kích thước và clear giữa các lần vẽ
+fig, ax = plt.subplots(figsize=(6, 4))
 
 # Biểu đồ 1: Domain of papers
-plt.figure(figsize=(6, 4))
-sns.barplot(data=df_domain, x="Domain", y="Number of Papers", palette="Set2")
-plt.title("Number of Papers by Domain")
-plt.xlabel("Domain")
-plt.ylabel("Number of Papers")
-plt.tight_layout()
-plt.savefig("charts/papers_by_domain_seaborn.png")
-plt.close()
+ax.bar(domains, domain_counts, color=sns.color_palette("Set2", len(domains)))
+ax.set_title("Number of Papers by Domain")
+ax.set_xlabel("Domain")
+ax.set_ylabel("Number of Papers")
+fig.tight_layout()
+fig.savefig("charts/papers_by_domain_seaborn.png")
+ax.clear()
 
 # Biểu đồ 2: Question type
-plt.figure(figsize=(6, 4))
-sns.barplot(
-    data=df_question, x="Question Type", y="Number of Questions", palette="Set3"
+ax.bar(
+    question_types, question_counts, color=sns.color_palette("Set3", len(question_types))
 )
-plt.title("Number of Questions by Type")
-plt.xlabel("Question Type")
-plt.ylabel("Number of Questions")
-plt.tight_layout()
-plt.savefig("charts/questions_by_type_seaborn.png")
-plt.close()
+ax.set_title("Number of Questions by Type")
+ax.set_xlabel("Question Type")
+ax.set_ylabel("Number of Questions")
+fig.tight_layout()
+fig.savefig("charts/questions_by_type_seaborn.png")
+ax.clear()
 
 # Biểu đồ tròn 1: Domain of papers (pie chart)
-plt.figure(figsize=(6, 6))
-colors = sns.color_palette("Set2", len(df_domain))
+fig.set_size_inches(6, 6)
+colors = sns.color_palette("Set2", len(domains))
 
 
-def make_autopct(values):
+def make_autopct(total):
+    # Nhận tổng đã tính sẵn: closure chỉ còn một phép nhân mỗi wedge,
+    # không gọi lại sum(values) cho từng lát
+    val_per_pct = total / 100.0
+
     def my_autopct(pct):
-        total = sum(values)
-        val = int(round(pct * total / 100.0))
-        return f"{pct:.1f}%\n({val})"
+        return f"{pct:.1f}%\n({int(round(pct * val_per_pct))})"
 
     return my_autopct
 
 
-plt.pie(
-    df_domain["Number of Papers"],
-    labels=df_domain["Domain"],
-    autopct=make_autopct(df_domain["Number of Papers"]),
+ax.pie(
+    domain_counts,
+    labels=domains,
+    autopct=make_autopct(sum(domain_counts)),
     startangle=140,
     colors=colors,
     textprops={"fontsize": 12},
 )
-plt.title("Distribution of Papers by Domain")
-plt.legend(
-    df_domain["Domain"], title="Domain", loc="best", fontsize=10, title_fontsize=11
-)
-plt.tight_layout()
-plt.savefig("charts/papers_by_domain_pie.png")
-plt.close()
+ax.set_title("Distribution of Papers by Domain")
+ax.legend(domains, title="Domain", loc="best", fontsize=10, title_fontsize=11)
+fig.tight_layout()
+fig.savefig("charts/papers_by_domain_pie.png")
+ax.clear()
 
 # Biểu đồ tròn 2: Question type (pie chart)
-plt.figure(figsize=(6, 6))
-colors = sns.color_palette("Set3", len(df_question))
-plt.pie(
-    df_question["Number of Questions"],
-    labels=df_question["Question Type"],
-    autopct=make_autopct(df_question["Number of Questions"]),
+colors = sns.color_palette("Set3", len(question_types))
+ax.pie(
+    question_counts,
+    labels=question_types,
+    autopct=make_autopct(sum(question_counts)),
     startangle=140,
     colors=colors,
     textprops={"fontsize": 12},
 )
-plt.title("Distribution of Questions by Type")
-plt.legend(
-    df_question["Question Type"],
+ax.set_title("Distribution of Questions by Type")
+ax.legend(
+    question_types,
     title="Question Type",
     loc="best",
     fontsize=10,
     title_fontsize=11,
 )
-plt.tight_layout()
-plt.savefig("charts/questions_by_type_pie.png")
-plt.close()
+fig.tight_layout()
+fig.savefig("charts/questions_by_type_pie.png")
+plt.close(fig)
 
 print("Đã lưu hai biểu đồ cột và hai biểu đồ tròn vào thư mục charts/.")
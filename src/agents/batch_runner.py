@@ -0,0 +1,145 @@
+"""
+Batched LLM execution for offline/bulk agent workloads.
+
+Interactive chat turns go through the normal ADK agent loop, but bulk jobs
+(RAG evaluation, mass ingestion) issue many independent prompts at once. For
+OpenAI models those can ride the Batch API, which costs ~50% of synchronous
+pricing; for other providers the prompts are multiplexed with a
+bounded-concurrency gather so throughput scales without hammering rate limits.
+"""
+
+import asyncio
+import io
+import json
+from typing import List, Optional
+
+from src.core.logger import logger
+
+DEFAULT_CONCURRENCY = 8
+BATCH_POLL_INTERVAL = 10.0  # seconds
+
+
+async def run_batch(
+    model: str,
+    instruction: str,
+    queries: List[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_batch_api: bool = False,
+) -> List[str]:
+    """
+    Run many independent prompts against one model; responses are returned
+    in input order.
+
+    Args:
+        model: LiteLLM model string (e.g. "openai/gpt-4.1-mini")
+        instruction: System prompt shared by every request
+        queries: The user prompts
+        concurrency: Max in-flight requests on the gather path
+        use_batch_api: Route OpenAI models through /v1/batches (cheaper but
+            minutes-to-hours of turnaround; only for offline jobs)
+
+    Returns:
+        List of response texts, aligned with queries.
+    """
+    if not queries:
+        return []
+    if use_batch_api and model.startswith("openai/"):
+        try:
+            results = await _run_openai_batch(
+                model.split("/", 1)[1], instruction, queries
+            )
+        except Exception as e:
+            logger.warning(f"Batch API failed, falling back to gather: {e}")
+        else:
+            # Per-request failures land in the batch's error file, not the
+            # output file, and leave their slot None; re-run just those
+            # through the gather path so every slot holds a response text.
+            missing = [i for i, text in enumerate(results) if text is None]
+            if missing:
+                logger.warning(
+                    f"Batch left {len(missing)} requests unanswered; "
+                    "retrying them via gather"
+                )
+                retried = await _run_gather(
+                    model, instruction, [queries[i] for i in missing], concurrency
+                )
+                for i, text in zip(missing, retried):
+                    results[i] = text
+            return results
+    return await _run_gather(model, instruction, queries, concurrency)
+
+
+async def _run_gather(
+    model: str, instruction: str, queries: List[str], concurrency: int
+) -> List[str]:
+    import litellm
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(query: str) -> str:
+        async with sem:
+            response = await litellm.acompletion(
+                model=model,
+                messages=[
+                    {"role": "system", "content": instruction},
+                    {"role": "user", "content": query},
+                ],
+            )
+            return response.choices[0].message.content
+
+    return list(await asyncio.gather(*(one(q) for q in queries)))
+
+
+async def _run_openai_batch(
+    model: str, instruction: str, queries: List[str]
+) -> List[Optional[str]]:
+    """
+    Submit the queries as one /v1/batches job and poll it to completion.
+
+    Requests that fail inside an otherwise-completed batch are reported via
+    the batch's error file and leave their slot None; run_batch backfills
+    those through the gather path.
+    """
+    from openai import AsyncOpenAI
+
+    client = AsyncOpenAI()
+    lines = io.BytesIO(
+        b"".join(
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": [
+                            {"role": "system", "content": instruction},
+                            {"role": "user", "content": query},
+                        ],
+                    },
+                }
+            ).encode()
+            + b"\n"
+            for i, query in enumerate(queries)
+        )
+    )
+    batch_file = await client.files.create(file=lines, purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted OpenAI batch {batch.id} with {len(queries)} requests")
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
+        batch = await client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    content = await client.files.content(batch.output_file_id)
+    results: List[Optional[str]] = [None] * len(queries)
+    for line in content.text.splitlines():
+        record = json.loads(line)
+        body = record["response"]["body"]
+        results[int(record["custom_id"])] = body["choices"][0]["message"]["content"]
+    return results
@@ -4,11 +4,12 @@ Context Analyzer Agent for the AI-Powered Knowledge Base System.
 This agent analyzes the user's session context using ADK's InMemorySession and DatabaseSession.
 """
 
+import asyncio
 from typing import Optional, Tuple
 from contextlib import AsyncExitStack
 
 from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from src.core.llm_pool import get_litellm
 
 from src.core.config import DEFAULT_LLM_MODEL
 from src.core.logger import logger
@@ -21,9 +22,20 @@ class ContextAnalyzerAgent:
 
     def __init__(self, model: Optional[str] = None):
         self.model = model or DEFAULT_LLM_MODEL
+        # Memoized (agent, exit_stack) tuple so repeated orchestrations reuse
+        # one constructed agent instead of rebuilding it per request
+        self._cached: Optional[Tuple[Agent, AsyncExitStack]] = None
+        self._build_lock = asyncio.Lock()
         logger.info(f"Initializing Context Analyzer Agent with model: {self.model}")
 
     async def create_agent(self) -> Tuple[Agent, AsyncExitStack]:
+        if self._cached is None:
+            async with self._build_lock:
+                if self._cached is None:
+                    self._cached = await self._build_agent()
+        return self._cached
+
+    async def _build_agent(self) -> Tuple[Agent, AsyncExitStack]:
         instruction = """
         You are a context analysis agent. Your job is to examine the user's session context, including conversation history and any stored session data (using InMemorySession and DatabaseSession), to provide relevant context for downstream agents.
         - You must utilize all available information—including conversation history, session data (InMemorySession, DatabaseSession), user metadata, and any relevant system state—to thoroughly analyze and infer the user's true intent, goals, and context. Your analysis should be as comprehensive as possible to support downstream agents in fulfilling the user's request accurately.
@@ -31,7 +43,7 @@ class ContextAnalyzerAgent:
         """
         agent = Agent(
             name="context_analyzer_agent",
-            model=LiteLlm(model=self.model),
+            model=get_litellm(self.model),
             description="Agent that analyzes the user's session context using ADK session services.",
             instruction=instruction,
             tools=[],
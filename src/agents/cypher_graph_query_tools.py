@@ -1,17 +1,279 @@
+import atexit
 import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from neo4j import GraphDatabase, Query
+from neo4j import AsyncGraphDatabase, GraphDatabase, Query, RoutingControl
 from neo4j.time import DateTime, Date, Time, Duration
 from src.core.config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
 
+try:
+    # orjson serializes in C (~5x faster than stdlib json) and handles
+    # stdlib datetimes natively; fall back to json if unavailable.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    # pandas enables a vectorized fast path for flat tabular results; the
+    # per-record path below works without it.
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+# Process-wide driver shared by all tool calls. Driver construction spins up
+# an event loop and a fresh connection pool, so creating one per call costs a
+# TCP+TLS handshake every query and leaks sockets under concurrency.
+_driver = None
+_driver_lock = threading.Lock()
+
+# Bolt streams results in fetch_size batches (default 1000); RAG queries can
+# return several thousand rows, so a larger batch avoids the extra PULL round
+# trips. Only binary Bolt URIs (bolt://, neo4j://, and their +s variants) are
+# supported — the HTTP REST API is an order of magnitude slower per query.
+_FETCH_SIZE = 10_000
+
+
+def _check_bolt_uri():
+    if NEO4J_URI and NEO4J_URI.lower().startswith("http"):
+        import logging
+
+        logging.getLogger(__name__).warning(
+            "NEO4J_URI %r uses HTTP; the Neo4j HTTP API is far slower than "
+            "Bolt. Use a bolt:// or neo4j:// URI instead.",
+            NEO4J_URI,
+        )
+
+
+def _warm_pool(driver, connections: int = 4):
+    """Pre-establish pooled connections so the first real query doesn't pay
+    the TCP+TLS+Bolt handshake. Failures are ignored; queries will retry."""
+    try:
+        driver.verify_connectivity()
+
+        def ping():
+            with driver.session() as session:
+                session.run("RETURN 1").consume()
+
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            for future in [pool.submit(ping) for _ in range(connections)]:
+                future.result()
+    except Exception:
+        pass
+
+
+def _get_driver():
+    global _driver
+    if _driver is None:
+        with _driver_lock:
+            if _driver is None:
+                _check_bolt_uri()
+                _driver = GraphDatabase.driver(
+                    NEO4J_URI,
+                    auth=(NEO4J_USER, NEO4J_PASSWORD),
+                    max_connection_pool_size=50,
+                    connection_acquisition_timeout=30,
+                    fetch_size=_FETCH_SIZE,
+                )
+                # Warm in the background so the constructing call isn't
+                # blocked on handshakes either.
+                threading.Thread(
+                    target=_warm_pool, args=(_driver,), daemon=True
+                ).start()
+    return _driver
+
+
+atexit.register(lambda: _driver and _driver.close())
+
+# Async driver sharing the same credentials/pool limits, for agent tools that
+# overlap graph queries with LLM calls and other awaits.
+_async_driver = None
+_async_driver_lock = threading.Lock()
+
+
+def _get_async_driver():
+    global _async_driver
+    if _async_driver is None:
+        with _async_driver_lock:
+            if _async_driver is None:
+                _check_bolt_uri()
+                _async_driver = AsyncGraphDatabase.driver(
+                    NEO4J_URI,
+                    auth=(NEO4J_USER, NEO4J_PASSWORD),
+                    max_connection_pool_size=50,
+                    connection_acquisition_timeout=30,
+                    fetch_size=_FETCH_SIZE,
+                )
+    return _async_driver
+
+# Write-clause keywords blocked in execute_cypher_query. A precompiled
+# word-boundary regex scans the query once without the .upper() copy and
+# doesn't false-positive on substrings like 'reSET' inside identifiers.
+_FORBIDDEN_RE = re.compile(
+    r"\b(?:CREATE|SET|DELETE|MERGE|REMOVE|DROP)\b", re.IGNORECASE
+)
+
+# Bounded TTL+LRU cache of serialized query results: agents often repeat the
+# exact same read query, and a hashtable hit replaces a full Bolt round trip.
+_QUERY_CACHE_MAX = 256
+_QUERY_CACHE_TTL = 60.0
+_query_cache: OrderedDict = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+
+# Matches a RETURN clause projecting only bare variables (e.g. "RETURN n, m"),
+# optionally followed by ORDER BY/SKIP/LIMIT.
+_RETURN_BARE_VARS_RE = re.compile(
+    r"(\bRETURN\b\s+)"
+    r"([A-Za-z_][A-Za-z0-9_]*(?:\s*,\s*[A-Za-z_][A-Za-z0-9_]*)*)"
+    r"(\s*(?:\bORDER\b|\bSKIP\b|\bLIMIT\b|;|$).*)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _strip_embeddings_server_side(query: str) -> str:
+    """
+    Rewrite `RETURN n`-style projections so embedding properties are dropped
+    on the server and never transferred over Bolt.
+
+    Only bare-variable projections are rewritten; queries that already
+    project specific properties are returned unchanged. Callers should fall
+    back to the original query if the rewritten one fails (e.g. the variable
+    is not a node, or APOC is unavailable).
+    """
+    match = _RETURN_BARE_VARS_RE.search(query)
+    if not match:
+        return query
+    head, vars_part, tail = match.groups()
+    projected = ", ".join(
+        f"apoc.map.fromPairs([k IN keys({v}) "
+        f"WHERE NOT toLower(k) CONTAINS 'embedding' | [k, {v}[k]]]) AS {v}"
+        for v in (s.strip() for s in vars_part.split(","))
+    )
+    return query[: match.start()] + head + projected + tail
+
+
+# Safety cap injected when an LLM query has no LIMIT of its own: bounds Bolt
+# transfer, serialization time and peak memory regardless of what the model
+# hallucinates. The transaction timeout aborts runaway queries server-side
+# instead of letting them hold a worker (and a pooled connection) for minutes.
+_DEFAULT_ROW_LIMIT = 1000
+_QUERY_TIMEOUT = 30.0
+_LIMIT_RE = re.compile(r"\bLIMIT\s+(?:\d+|\$\w+)\b", re.IGNORECASE)
+
+
+def _ensure_row_limit(query: str) -> str:
+    if _LIMIT_RE.search(query):
+        return query
+    return f"{query.rstrip().rstrip(';')} LIMIT {_DEFAULT_ROW_LIMIT}"
+
+
+# String literals (with escapes) and standalone numeric literals in
+# LLM-generated Cypher; strings are matched first so numbers inside quoted
+# text are never touched.
+_LITERAL_RE = re.compile(
+    r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|\b\d+(?:\.\d+)?\b"""
+)
+_ESCAPE_RE = re.compile(r"\\(.)")
+
+
+def _parameterize_query(query: str):
+    """
+    Extract string/numeric literals from a Cypher query into named parameters.
+
+    LLM-generated queries typically differ only in their literal values;
+    rewriting them to `$p0`, `$p1`, ... lets the server's query-plan cache
+    match across calls instead of re-planning each variant.
+
+    Returns:
+        Tuple of (parameterized query, parameters dict).
+    """
+    params = {}
+
+    def repl(match):
+        token = match.group(0)
+        if token[0] in "'\"":
+            body = token[1:-1]
+            if any(c not in "\\'\"" for c in _ESCAPE_RE.findall(body)):
+                # \n, \t, \uXXXX etc. mean something to Cypher; stripping
+                # the backslash would change the value, so leave such
+                # literals inline rather than parameterize them wrongly.
+                return token
+            value = _ESCAPE_RE.sub(r"\1", body)
+        elif "." in token:
+            value = float(token)
+        else:
+            value = int(token)
+        name = f"p{len(params)}"
+        params[name] = value
+        return f"${name}"
+
+    return _LITERAL_RE.sub(repl, query), params
+
+
+def _is_embedding_key(k: str) -> bool:
+    # Neo4j property keys are almost always lowercase snake_case; testing the
+    # raw key first skips the k.lower() allocation on the hot path.
+    return "embedding" in k or (not k.islower() and "embedding" in k.lower())
+
+
+def _remove_embeddings(obj, _dict=dict, _list=list, _isinstance=isinstance):
+    """Drop keys containing 'embedding' from a record structure, in place.
+
+    Iterative (explicit stack) so deeply nested path results neither pay
+    per-frame recursion overhead nor hit the recursion limit. Builtins are
+    bound as defaults so the hot loop uses local (not global) lookups.
+    """
+    is_embedding_key = _is_embedding_key
+    containers = (_dict, _list)
+    stack = [obj]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        x = pop()
+        if _isinstance(x, _dict):
+            doomed = [k for k in x if is_embedding_key(k)]
+            for k in doomed:
+                del x[k]
+            for v in x.values():
+                if _isinstance(v, containers) and v:
+                    push(v)
+        else:  # list; only dicts and lists are ever pushed
+            for i in x:
+                if _isinstance(i, containers) and i:
+                    push(i)
+
+
+# Encoder dispatch by exact type: one hash lookup instead of a linear
+# isinstance chain on every non-primitive leaf.
+_ENCODERS = {
+    datetime: str,
+    date: str,
+    DateTime: str,
+    Date: str,
+    Time: str,
+    Duration: str,
+}
+
 
 def json_converter(o):
     """A custom JSON converter to handle Neo4j's date/time objects."""
-    if isinstance(o, (datetime, date, DateTime, Date, Time, Duration)):
-        return str(o)
+    encoder = _ENCODERS.get(type(o))
+    if encoder is not None:
+        return encoder(o)
     raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
 
 
+# db.schema.visualization() is an expensive server-side procedure whose
+# output only changes when the schema does (rare), so cache it with a TTL.
+_SCHEMA_TTL = 300.0
+_schema_cache = {"value": None, "expiry": 0.0}
+_schema_lock = threading.Lock()
+
+
 def get_graph_schema() -> str:
     """
     Retrieves the schema of the Neo4j graph database.
@@ -27,12 +289,27 @@ def get_graph_schema() -> str:
     Returns:
         A string representation of the graph schema.
     """
-    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+    now = time.monotonic()
+    if _schema_cache["value"] is not None and now < _schema_cache["expiry"]:
+        return _schema_cache["value"]
+
+    driver = _get_driver()
     try:
-        with driver.session() as session:
-            result = session.run(Query("CALL db.schema.visualization()")).single()
-            if not result:
+        # Single builder at a time so concurrent callers don't all hit the DB
+        # when the cache expires.
+        with _schema_lock:
+            now = time.monotonic()
+            if _schema_cache["value"] is not None and now < _schema_cache["expiry"]:
+                return _schema_cache["value"]
+
+            # execute_query handles session/transaction/retries internally and
+            # routes to a read replica in clustered deployments.
+            records, _, _ = driver.execute_query(
+                "CALL db.schema.visualization()", routing_=RoutingControl.READ
+            )
+            if not records:
                 return "Schema not found."
+            result = records[0]
 
             nodes = result.get("nodes", [])
             relationships = result.get("relationships", [])
@@ -41,23 +318,34 @@ def get_graph_schema() -> str:
 
             if nodes:
                 schema_parts.append("Node labels and properties:")
-                for node in nodes:
-                    label = node.get("name")
-                    properties = ", ".join(node.get("properties", []))
-                    schema_parts.append(f"- {label}: ({properties})")
+                schema_parts.extend(
+                    f"- {node.get('name')}: ({', '.join(node.get('properties', ()))})"
+                    for node in nodes
+                )
 
             if relationships:
                 schema_parts.append("\nRelationship types:")
-                for rel in relationships:
-                    rel_type = rel[1]
-                    schema_parts.append(f"- {rel_type}")
+                schema_parts.extend(f"- {rel[1]}" for rel in relationships)
+
+            if not schema_parts:
+                return "Schema not found."
 
-            return "\n".join(schema_parts) if schema_parts else "Schema not found."
+            schema = "\n".join(schema_parts)
+            _schema_cache["value"] = schema
+            _schema_cache["expiry"] = time.monotonic() + _SCHEMA_TTL
+            return schema
 
     except Exception as e:
         return f"Error retrieving schema: {e}"
-    finally:
-        driver.close()
+
+
+def _invalidate_schema_cache():
+    """Force the next get_graph_schema call to refetch from the database."""
+    _schema_cache["value"] = None
+    _schema_cache["expiry"] = 0.0
+
+
+get_graph_schema.invalidate = _invalidate_schema_cache
 
 
 def execute_cypher_query(query: str) -> str:
@@ -76,6 +364,9 @@ def execute_cypher_query(query: str) -> str:
         (e.g., 'embedding', 'name_embedding') are automatically removed from the
         results before serialization.
 
+        The database connection uses the binary Bolt protocol; NEO4J_URI must
+        be a bolt:// or neo4j:// URI (HTTP URIs are not supported).
+
         Args:
             query: The Cypher query to execute.
 
@@ -121,33 +412,165 @@ def execute_cypher_query(query: str) -> str:
 
     ```
     """
-    forbidden_keywords = ["CREATE", "SET", "DELETE", "MERGE", "REMOVE", "DROP"]
-    if any(keyword in query.upper() for keyword in forbidden_keywords):
+    if _FORBIDDEN_RE.search(query):
+        return json.dumps({"error": "This tool only supports read-only queries."})
+
+    # Whitespace-normalized query string is the cache key; bad queries never
+    # reach this point, and errors below are never cached.
+    cache_key = " ".join(query.split())
+    now = time.monotonic()
+    with _query_cache_lock:
+        hit = _query_cache.get(cache_key)
+        if hit is not None and now - hit[0] < _QUERY_CACHE_TTL:
+            _query_cache.move_to_end(cache_key)
+            return hit[1]
+
+    driver = _get_driver()
+    try:
+        # The query is dynamic; security is handled by the keyword check above.
+        # execute_query manages the session/transaction and routes reads to a
+        # replica in clustered deployments.
+        # Lift literals into parameters (server plan-cache hits), then prefer
+        # dropping embeddings server-side so the vectors are never serialized
+        # over Bolt; fall back to the raw query (and the Python filter below)
+        # if either rewrite broke it.
+        bounded = _ensure_row_limit(query)
+        pquery, params = _parameterize_query(bounded)
+        rewritten = _strip_embeddings_server_side(pquery)
+        try:
+            raw_records, _, result_keys = driver.execute_query(
+                Query(rewritten, timeout=_QUERY_TIMEOUT),
+                parameters_=params,
+                routing_=RoutingControl.READ,
+            )
+        except Exception:
+            if rewritten == bounded:
+                raise
+            raw_records, _, result_keys = driver.execute_query(
+                Query(bounded, timeout=_QUERY_TIMEOUT),
+                routing_=RoutingControl.READ,
+            )
+        return _serialize_and_cache(raw_records, cache_key, result_keys)
+    except Exception as e:
+        return json.dumps({"error": f"Query failed: {e}"})
+
+
+async def aexecute_cypher_query(query: str) -> str:
+    """
+    Async variant of execute_cypher_query using the neo4j async driver.
+
+    Same read-only guard, embedding filtering, caching and JSON output as
+    execute_cypher_query, but awaitable — concurrent tool invocations from
+    the orchestrating agent overlap on network I/O instead of serializing.
+
+    Args:
+        query: The Cypher query to execute.
+
+    Returns:
+        A JSON string representing the query results, or an error message.
+    """
+    if _FORBIDDEN_RE.search(query):
         return json.dumps({"error": "This tool only supports read-only queries."})
 
-    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+    cache_key = " ".join(query.split())
+    now = time.monotonic()
+    with _query_cache_lock:
+        hit = _query_cache.get(cache_key)
+        if hit is not None and now - hit[0] < _QUERY_CACHE_TTL:
+            _query_cache.move_to_end(cache_key)
+            return hit[1]
+
+    driver = _get_async_driver()
     try:
-        with driver.session() as session:
-            # The query is dynamic, so we suppress the type checker warning.
-            # Security is handled by the keyword check above.
-            result = session.run(Query(query))  # type: ignore
-            records = [record.data() for record in result]
-
-            def _remove_embeddings_recursive(obj):
-                if isinstance(obj, dict):
-                    return {
-                        k: _remove_embeddings_recursive(v)
-                        for k, v in obj.items()
-                        if "embedding" not in k.lower()
-                    }
-                if isinstance(obj, list):
-                    return [_remove_embeddings_recursive(i) for i in obj]
-                return obj
-
-            processed_records = _remove_embeddings_recursive(records)
-
-            return json.dumps(processed_records, indent=2, default=json_converter)
+        bounded = _ensure_row_limit(query)
+        pquery, params = _parameterize_query(bounded)
+        rewritten = _strip_embeddings_server_side(pquery)
+        try:
+            raw_records, _, result_keys = await driver.execute_query(
+                Query(rewritten, timeout=_QUERY_TIMEOUT),
+                parameters_=params,
+                routing_=RoutingControl.READ,
+            )
+        except Exception:
+            if rewritten == bounded:
+                raise
+            raw_records, _, result_keys = await driver.execute_query(
+                Query(bounded, timeout=_QUERY_TIMEOUT),
+                routing_=RoutingControl.READ,
+            )
+        return _serialize_and_cache(raw_records, cache_key, result_keys)
     except Exception as e:
         return json.dumps({"error": f"Query failed: {e}"})
-    finally:
-        driver.close()
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _serialize_tabular(raw_records):
+    """Fast path for flat tabular results (the common case for RAG queries):
+    materialize the records into pandas, where row conversion happens in C,
+    drop embedding columns with one vectorized mask instead of per-record
+    recursion, and serialize with DataFrame.to_json. Returns None when the
+    result holds nested values (nodes, maps, paths) or conversion fails, in
+    which case the caller uses the per-record path.
+    """
+    if not all(isinstance(v, _SCALAR_TYPES) for v in raw_records[0].values()):
+        return None
+    try:
+        df = pd.DataFrame(raw_records, columns=raw_records[0].keys())
+        df = df.loc[:, ~df.columns.str.contains("embedding", case=False)]
+        return df.to_json(orient="records", indent=2)
+    except Exception:
+        return None
+
+
+def _serialize_and_cache(raw_records, cache_key, result_keys=None):
+    if pd is not None and raw_records:
+        tabular = _serialize_tabular(raw_records)
+        if tabular is not None:
+            _store_in_cache(cache_key, tabular)
+            return tabular
+
+    # Project only the wanted columns through record.data(): when a returned
+    # column is itself an embedding, the driver never converts it to Python.
+    wanted_keys = ()
+    if result_keys:
+        wanted_keys = tuple(k for k in result_keys if not _is_embedding_key(k))
+        if len(wanted_keys) == len(result_keys):
+            wanted_keys = ()  # nothing to drop; use the default full data()
+    # Filter each record as it is consumed instead of materializing the
+    # whole result and rebuilding every dict/list afterwards; embedding
+    # values are dropped in place and never retained in the records list.
+    records = []
+    for record in raw_records:
+        data = record.data(*wanted_keys)
+        _remove_embeddings(data)
+        records.append(data)
+
+    if orjson is not None:
+        serialized = orjson.dumps(
+            records,
+            default=json_converter,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+    else:
+        serialized = json.dumps(records, indent=2, default=json_converter)
+    _store_in_cache(cache_key, serialized)
+    return serialized
+
+
+def _store_in_cache(cache_key, serialized):
+    with _query_cache_lock:
+        _query_cache[cache_key] = (time.monotonic(), serialized)
+        _query_cache.move_to_end(cache_key)
+        while len(_query_cache) > _QUERY_CACHE_MAX:
+            _query_cache.popitem(last=False)
+
+
+def _clear_query_cache():
+    """Drop all cached query results (call after external writes)."""
+    with _query_cache_lock:
+        _query_cache.clear()
+
+
+execute_cypher_query.cache_clear = _clear_query_cache
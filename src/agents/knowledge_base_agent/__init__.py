@@ -8,11 +8,11 @@ for handling knowledge base retrieval.
 from .agent import (
     KnowledgeBaseAgent,
     knowledge_base_agent,
-    knowledge_base_agent_instance,
+    get_knowledge_base_agent_instance,
 )
 
 __all__ = [
     "KnowledgeBaseAgent",
     "knowledge_base_agent",
-    "knowledge_base_agent_instance",
+    "get_knowledge_base_agent_instance",
 ]
\ No newline at end of file
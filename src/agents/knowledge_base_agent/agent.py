@@ -6,17 +6,19 @@ Agent Development Kit (ADK). The Knowledge Base Agent is responsible for
 retrieving and synthesizing information about scientific papers from the knowledge base (LightRAG backend).
 """
 
+import asyncio
 from typing import Optional, Tuple
 from contextlib import AsyncExitStack
 
 from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from src.core.llm_pool import get_litellm
 from google.adk.tools import FunctionTool
 
 from src.core.config import DEFAULT_LLM_MODEL, DOWNLOADS_DIR
 from src.core.logger import logger
 from src.agents.knowledge_base_agent.tools import query_knowledge_base_tools
 from src.agents.knowledge_base_agent.tools import paper_search_mcp_tools
+from src.agents.cypher_graph_query_tools import aexecute_cypher_query
 
 
 class KnowledgeBaseAgent:
@@ -36,17 +38,35 @@ class KnowledgeBaseAgent:
             model: The LLM model to use (defaults to the configured DEFAULT_LLM_MODEL)
         """
         self.model = model or DEFAULT_LLM_MODEL
+        # Memoized (agent, exit_stack) tuple: rebuilding spawns the MCP
+        # Docker containers again, which costs hundreds of ms per toolset
+        self._cached: Optional[Tuple[Agent, AsyncExitStack]] = None
+        self._build_lock = asyncio.Lock()
         logger.info(f"Initializing Knowledge Base Agent with model: {self.model}")
 
     async def create_agent(self) -> Tuple[Agent, AsyncExitStack]:
         """
-        Create the ADK Agent instance for the Knowledge Base Agent.
+        Create (or return the cached) ADK Agent instance for the Knowledge Base Agent.
+
+        The agent and its MCP toolsets are built once per process; subsequent
+        calls reuse the running MCP servers instead of relaunching them.
 
         Returns:
             Tuple of (the configured ADK Agent instance, combined exit stack)
         """
-        # Only include the tool for querying scientific paper knowledge base
-        local_tools = [FunctionTool(query_knowledge_base_tools)]
+        if self._cached is None:
+            async with self._build_lock:
+                if self._cached is None:
+                    self._cached = await self._build_agent()
+        return self._cached
+
+    async def _build_agent(self) -> Tuple[Agent, AsyncExitStack]:
+        # Tools for querying the scientific paper knowledge base; the async
+        # Cypher tool lets graph queries overlap with other awaited tool calls
+        local_tools = [
+            FunctionTool(query_knowledge_base_tools),
+            FunctionTool(aexecute_cypher_query),
+        ]
 
         combined_exit_stack = AsyncExitStack()
 
@@ -56,6 +76,9 @@ class KnowledgeBaseAgent:
             local_tools.extend(paper_tools)
         if paper_exit_stack:
             await combined_exit_stack.enter_async_context(paper_exit_stack)
+        # MCP servers don't guarantee tool enumeration order; sort by name so
+        # the tool-schema prompt prefix is stable across processes/deploys.
+        local_tools.sort(key=lambda t: t.name)
 
         instruction = """
         You are an expert agent for the Scientific Paper Knowledge Base System.
@@ -77,7 +100,7 @@ class KnowledgeBaseAgent:
 
         agent = Agent(
             name="scientific_paper_knowledge_base_agent",
-            model=LiteLlm(model=self.model),
+            model=get_litellm(self.model),
             description="You are the Knowledge Base Agent for the Scientific Paper Knowledge Base System. You retrieve and synthesize information about scientific papers from the knowledge base (LightRAG backend).",
             instruction=instruction,
             tools=local_tools,
@@ -100,7 +123,19 @@ async def create_agent() -> Tuple[Agent, AsyncExitStack]:
     return await knowledge_base_agent.create_agent()
 
 
-# agent instance for adk web
-knowledge_base_agent_instance = knowledge_base_agent.create_agent()
-root_agent = knowledge_base_agent_instance
-logger.info("Scientific Paper Knowledge Base Agent initialized successfully")
+async def get_knowledge_base_agent_instance() -> Tuple[Agent, AsyncExitStack]:
+    """
+    Lazy accessor for the (agent, exit_stack) tuple.
+
+    The old module-level `knowledge_base_agent_instance = ...create_agent()`
+    binding was an unawaited coroutine, and evaluating it eagerly would spin
+    up the MCP servers at import time. Await this instead when the agent is
+    actually needed; the underlying build is memoized.
+    """
+    return await knowledge_base_agent.create_agent()
+
+
+# agent instance for adk web: a coroutine that adk awaits on first use, so
+# nothing is built (and no MCP containers are launched) at import time
+root_agent = create_agent()
+logger.info("Scientific Paper Knowledge Base Agent module loaded")
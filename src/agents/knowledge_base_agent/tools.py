@@ -1,3 +1,5 @@
+import asyncio
+import atexit
 import os
 from typing import Optional, Tuple
 from contextlib import AsyncExitStack
@@ -7,7 +9,9 @@ from google.adk.models.lite_llm import LiteLlm
 from google.adk.tools import FunctionTool
 from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
 from src.kb_service.graph_module import KnowledgeGraphModule
+from src.kb_service.semantic_cache import semantic_cache
 from src.core.logger import logger
+from src.core.query_norm import normalize
 
 
 async def query_knowledge_base_tools(query: str):
@@ -20,12 +24,23 @@ async def query_knowledge_base_tools(query: str):
     Returns:
         The response from the knowledge base
     """
+    # Normalized queries widen cache hits (semantic cache here, prompt-prefix
+    # caches downstream); the raw text is only needed for display.
+    query = normalize(query)
+    # Repeat (or near-repeat) queries are answered from the semantic cache
+    # without a retrieval round trip (off-loop: the near-hit tier embeds).
+    cached = await semantic_cache.aget(query)
+    if cached is not None:
+        return cached
+
     os.environ["KNOWLEDGE_GRAPH_BACKEND"] = "light_rag"
     kb_service = KnowledgeGraphModule()
 
-    logger.info(f"Querying Knowledge Base Service with LightRAG backend...")
+    logger.info("Querying Knowledge Base Service with LightRAG backend...")
     response = await kb_service.async_query(query)
-    logger.info(f"Query response: {response}")
+    logger.opt(lazy=True).debug("Query response: {}", lambda: response)
+    if isinstance(response, str):
+        semantic_cache.put(query, response)
     return response
 
 
@@ -109,30 +124,59 @@ async def atlassian_mcp_tools():
         return [], None
 
 
+# The paper-search MCP session is process-lived: spawning the server and
+# handshaking costs hundreds of ms, and several agents share the toolset, so
+# the connection is opened once and owned here. Failures are not cached — a
+# later call retries the connection.
+_paper_search_tools = None
+_paper_search_stack = None
+_paper_search_lock = asyncio.Lock()
+
+
+def _shutdown_paper_search():
+    stack = _paper_search_stack
+    if stack is not None:
+        try:
+            asyncio.run(stack.aclose())
+        except Exception:
+            pass
+
+
 async def paper_search_mcp_tools():
     """
-    Initialize MCP tools for Paper Search integration.
+    Initialize (or reuse) MCP tools for Paper Search integration.
 
-    This function starts the MCP Paper Search server using the uvicorn runner and initializes the toolset for use by the agent.
+    The MCP Paper Search server is started once per process and kept alive;
+    subsequent calls return the cached toolset with zero I/O. Because the
+    connection is owned by this module (closed atexit), callers always
+    receive None for the exit stack.
 
     Returns:
-        Tuple of (list of MCP tools, exit stack) or ([], None) if initialization fails
+        Tuple of (list of MCP tools, None) or ([], None) if initialization fails
     """
-    try:
-        # Use the project root as the working directory so imports and file paths resolve correctly
-        server_params = StdioServerParameters(
-            command="uv",
-            args=[
-                "run",
-                "-m",
-                "paper_search_mcp.server",
-            ],
-        )
-        tools, exit_stack = await MCPToolset.from_server(
-            connection_params=server_params
-        )
-        logger.info("MCP Paper Search Toolset created successfully.")
-        return tools, exit_stack
-    except Exception as e:
-        logger.warning(f"Failed to connect to MCP Paper Search server: {e}")
-        return [], None
+    global _paper_search_tools, _paper_search_stack
+    if _paper_search_tools is not None:
+        return _paper_search_tools, None
+    async with _paper_search_lock:
+        if _paper_search_tools is not None:
+            return _paper_search_tools, None
+        try:
+            # Use the project root as the working directory so imports and file paths resolve correctly
+            server_params = StdioServerParameters(
+                command="uv",
+                args=[
+                    "run",
+                    "-m",
+                    "paper_search_mcp.server",
+                ],
+            )
+            tools, exit_stack = await MCPToolset.from_server(
+                connection_params=server_params
+            )
+            _paper_search_tools, _paper_search_stack = tools, exit_stack
+            atexit.register(_shutdown_paper_search)
+            logger.info("MCP Paper Search Toolset created successfully.")
+            return tools, None
+        except Exception as e:
+            logger.warning(f"Failed to connect to MCP Paper Search server: {e}")
+            return [], None
@@ -4,11 +4,12 @@ LLM Guard Defender Agent for prompt injection defense in the AI-Powered Knowledg
 This agent acts as a gatekeeper, sanitizing and validating user input to defend against prompt injection attacks.
 """
 
+import asyncio
 from typing import Optional, Tuple
 from contextlib import AsyncExitStack
 
 from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from src.core.llm_pool import get_litellm
 
 from src.core.config import DEFAULT_LLM_MODEL
 from src.core.logger import logger
@@ -21,9 +22,20 @@ class LlmGuardDefenderAgent:
 
     def __init__(self, model: Optional[str] = None):
         self.model = model or DEFAULT_LLM_MODEL
+        # Memoized (agent, exit_stack) tuple so repeated orchestrations reuse
+        # one constructed agent instead of rebuilding it per request
+        self._cached: Optional[Tuple[Agent, AsyncExitStack]] = None
+        self._build_lock = asyncio.Lock()
         logger.info(f"Initializing LLM Guard Defender Agent with model: {self.model}")
 
     async def create_agent(self) -> Tuple[Agent, AsyncExitStack]:
+        if self._cached is None:
+            async with self._build_lock:
+                if self._cached is None:
+                    self._cached = await self._build_agent()
+        return self._cached
+
+    async def _build_agent(self) -> Tuple[Agent, AsyncExitStack]:
         instruction = """
 You are a security and intent guard agent for a Large Language Model (LLM) system. Your responsibilities are:
 
@@ -53,7 +65,7 @@ Your output should be:
         """
         agent = Agent(
             name="llm_guard_defender_agent",
-            model=LiteLlm(model=self.model),
+            model=get_litellm(self.model),
             description="Agent that defends against prompt injection and classifies user intent (greeting vs. query).",
             instruction=instruction,
             tools=[],
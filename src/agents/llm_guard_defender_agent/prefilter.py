@@ -0,0 +1,82 @@
+"""
+Lexical prefilter for the LLM Guard Defender Agent.
+
+Running a full LLM call on every query just to classify it as safe is the
+single largest fixed cost in the pipeline, yet most prompt-injection attempts
+carry obvious lexical signals (instruction-override phrasing, role spoofing,
+encoded payloads). These precompiled patterns classify the clear-cut cases in
+microseconds so the LLM-based guard only sees ambiguous inputs.
+
+Patterns are compiled once at import with the stdlib `re` engine; they are
+all literal-anchored alternations, so matching is effectively linear.
+"""
+
+import re
+
+# Signals that almost always indicate an injection attempt (derived from the
+# common OWASP LLM prompt-injection phrasings).
+_MALICIOUS_RE = re.compile(
+    r"(?:"
+    r"ignore\s+(?:all\s+|any\s+)?(?:previous|prior|above|earlier)\s+(?:instructions|prompts|rules|directives)"
+    r"|disregard\s+(?:all\s+|any\s+)?(?:previous|prior|above|your)\s+(?:instructions|prompts|rules)"
+    r"|forget\s+(?:all\s+|any\s+)?(?:previous|prior|your)\s+(?:instructions|rules|training)"
+    r"|you\s+are\s+(?:now\s+)?(?:dan|in\s+developer\s+mode|jailbroken)"
+    r"|(?:^|\n)\s*(?:system|assistant)\s*:"
+    r"|reveal\s+(?:your\s+)?(?:system\s+prompt|instructions|hidden\s+rules)"
+    r"|print\s+(?:your\s+)?(?:system\s+prompt|initial\s+instructions)"
+    r"|do\s+anything\s+now"
+    r"|pretend\s+(?:you\s+have\s+no|there\s+are\s+no)\s+(?:restrictions|rules|guidelines)"
+    r")",
+    re.IGNORECASE,
+)
+
+# Constructs that merit the full LLM guard even when no malicious phrase
+# matched: code/markup blocks, role markers, long opaque (base64-like) runs.
+_SUSPICIOUS_RE = re.compile(
+    r"```"
+    r"|<\s*/?\s*(?:system|script|prompt)"
+    r"|\{\{.*?\}\}"
+    r"|[A-Za-z0-9+/=]{40,}"
+    r"|\\u00|&#x?\d+;"
+)
+
+# Generous upper bound: genuine questions are short; multi-kilobyte inputs
+# are worth a real look.
+_MAX_OBVIOUSLY_SAFE_LEN = 500
+
+
+def is_obviously_malicious(query: str) -> bool:
+    """True when the query matches a known injection signature."""
+    return _MALICIOUS_RE.search(query) is not None
+
+
+def is_obviously_safe(query: str) -> bool:
+    """
+    True when the query is short, free of injection signatures and free of
+    constructs (code blocks, role markers, encoded blobs) that would merit
+    the full LLM-based guard.
+    """
+    if len(query) > _MAX_OBVIOUSLY_SAFE_LEN:
+        return False
+    if _MALICIOUS_RE.search(query) is not None:
+        return False
+    return _SUSPICIOUS_RE.search(query) is None
+
+
+def fast_guard_check(query: str) -> str:
+    """
+    Classify a user query lexically before involving the LLM guard.
+
+    Args:
+        query: The raw user query.
+
+    Returns:
+        "safe" when the query can skip the LLM guard, "malicious" when it
+        matches a known prompt-injection signature and must be blocked, or
+        "ambiguous" when the LLM guard agent should make the call.
+    """
+    if is_obviously_malicious(query):
+        return "malicious"
+    if is_obviously_safe(query):
+        return "safe"
+    return "ambiguous"
@@ -7,13 +7,13 @@ This module contains the Master Agent implementation for orchestrating all sub-a
 from .agent import (
     MasterAgent,
     master_agent,
-    master_agent_instance,
+    get_root_agent,
     root_agent,
 )
 
 __all__ = [
     "MasterAgent",
     "master_agent",
-    "master_agent_instance",
+    "get_root_agent",
     "root_agent",
 ]
@@ -0,0 +1,97 @@
+"""
+Dependency-graph scheduler for master-agent tool orchestration.
+
+The orchestration pipeline is not a straight line: its true shape is
+guard -> {context, retrieve} and context -> research, so retrieval can start
+the moment the guard passes instead of waiting on context analysis. This
+module runs such a DAG wave by wave — every node whose dependencies are
+satisfied is dispatched in the same asyncio.gather — which keeps wall-clock
+latency at the critical-path sum rather than the total sum.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from src.core.logger import logger
+
+
+@dataclass(frozen=True)
+class ToolNode:
+    """
+    One step in the orchestration DAG.
+
+    Attributes:
+        name: Unique node name; its result is stored in the context under
+            this key.
+        deps: Names of nodes that must complete before this one runs.
+        fn: Async callable receiving the shared context dict (which already
+            holds the results of all dependencies) and returning this node's
+            result.
+    """
+
+    name: str
+    deps: Set[str] = field(default_factory=set)
+    fn: Callable[[Dict[str, Any]], Awaitable[Any]] = None
+
+
+async def run_dag(
+    nodes: List[ToolNode], ctx: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Execute a DAG of tool nodes, gathering every ready group concurrently.
+
+    Args:
+        nodes: The DAG; dependency names must refer to other nodes in the list.
+        ctx: Optional initial context (e.g. {"query": ...}); node results are
+            merged into it under their node names.
+
+    Returns:
+        The context dict containing every node's result.
+
+    Raises:
+        ValueError: On duplicate names, unknown dependencies, or cycles.
+    """
+    names = {node.name for node in nodes}
+    if len(names) != len(nodes):
+        raise ValueError("Duplicate node names in DAG")
+    for node in nodes:
+        unknown = node.deps - names
+        if unknown:
+            raise ValueError(f"Node '{node.name}' depends on unknown nodes {unknown}")
+
+    ctx = ctx if ctx is not None else {}
+    done: Set[str] = set()
+    pending = list(nodes)
+    while pending:
+        ready = [node for node in pending if node.deps <= done]
+        if not ready:
+            raise ValueError(
+                f"Cycle in DAG among {[node.name for node in pending]}"
+            )
+        logger.debug(f"DAG wave: {[node.name for node in ready]}")
+        results = await asyncio.gather(*(node.fn(ctx) for node in ready))
+        for node, result in zip(ready, results):
+            ctx[node.name] = result
+            done.add(node.name)
+        pending = [node for node in pending if node.name not in done]
+    return ctx
+
+
+def build_orchestration_dag(
+    guard: Callable[[Dict[str, Any]], Awaitable[Any]],
+    context: Callable[[Dict[str, Any]], Awaitable[Any]],
+    research: Callable[[Dict[str, Any]], Awaitable[Any]],
+    retrieve: Callable[[Dict[str, Any]], Awaitable[Any]],
+) -> List[ToolNode]:
+    """
+    The master pipeline's dependency graph: retrieval needs only the guard's
+    verdict, research additionally needs the context analysis, so retrieve
+    runs concurrently with context and then with research.
+    """
+    return [
+        ToolNode("guard", set(), guard),
+        ToolNode("context", {"guard"}, context),
+        ToolNode("retrieve", {"guard"}, retrieve),
+        ToolNode("research", {"context"}, research),
+    ]
@@ -4,16 +4,26 @@ Researcher Agent for the AI-Powered Knowledge Base System.
 This agent specializes in searching for scientific papers on the internet using MCP tools.
 """
 
-from typing import Optional, Tuple
+import asyncio
+from typing import List, Optional, Tuple
 from contextlib import AsyncExitStack
 
 from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from src.core.llm_pool import get_litellm
 from google.adk.tools import FunctionTool
 
 from src.core.config import DEFAULT_LLM_MODEL
 from src.core.logger import logger
 from src.agents.knowledge_base_agent.tools import paper_search_mcp_tools
+from src.agents.batch_runner import run_batch
+
+# Frozen at module level so the string is byte-identical across calls;
+# provider prompt caches only reuse a prefix that matches exactly.
+_RESEARCHER_INSTRUCTION = """
+        You are a researcher agent. Your job is to search for scientific papers on the internet using MCP tools.
+        - Only return your findings as data for the synthesizer agent. Do not greet or instruct the user directly. Do not return any message to the user.
+        - Always provide clear references to the source of each paper in your data output.
+        """
 
 
 class ResearcherAgent:
@@ -23,23 +33,32 @@ class ResearcherAgent:
 
     def __init__(self, model: Optional[str] = None):
         self.model = model or DEFAULT_LLM_MODEL
+        # Memoized (agent, exit_stack) tuple: rebuilding re-launches the MCP
+        # paper-search server, which costs hundreds of ms per request
+        self._cached: Optional[Tuple[Agent, AsyncExitStack]] = None
+        self._build_lock = asyncio.Lock()
         logger.info(f"Initializing Researcher Agent with model: {self.model}")
 
     async def create_agent(self) -> Tuple[Agent, AsyncExitStack]:
+        if self._cached is None:
+            async with self._build_lock:
+                if self._cached is None:
+                    self._cached = await self._build_agent()
+        return self._cached
+
+    async def _build_agent(self) -> Tuple[Agent, AsyncExitStack]:
         local_tools = []
         paper_tools, paper_exit_stack = await paper_search_mcp_tools()
         if paper_tools:
             local_tools.extend(paper_tools)
-        instruction = """
-        You are a researcher agent. Your job is to search for scientific papers on the internet using MCP tools. 
-        - Only return your findings as data for the synthesizer agent. Do not greet or instruct the user directly. Do not return any message to the user.
-        - Always provide clear references to the source of each paper in your data output.
-        """
+        # MCP servers don't guarantee tool enumeration order; sort by name so
+        # the tool-schema prompt prefix is stable across processes/deploys.
+        local_tools.sort(key=lambda t: t.name)
         agent = Agent(
             name="researcher_agent",
-            model=LiteLlm(model=self.model),
+            model=get_litellm(self.model),
             description="Agent that searches for scientific papers on the internet using MCP tools.",
-            instruction=instruction,
+            instruction=_RESEARCHER_INSTRUCTION,
             tools=local_tools,
         )
         exit_stack = AsyncExitStack()
@@ -48,6 +67,22 @@ class ResearcherAgent:
         return agent, exit_stack
 
 
+    async def run_batch(
+        self, queries: List[str], use_batch_api: bool = False
+    ) -> List[str]:
+        """
+        Answer many independent research prompts in one burst.
+
+        Intended for offline workloads (bulk ingestion, RAG evaluation) where
+        tool use isn't needed; OpenAI models can ride the discounted Batch
+        API, other providers use a bounded-concurrency gather. Responses are
+        returned in input order.
+        """
+        return await run_batch(
+            self.model, _RESEARCHER_INSTRUCTION, queries, use_batch_api=use_batch_api
+        )
+
+
 researcher_agent = ResearcherAgent()
 
 
@@ -3,6 +3,7 @@ Configuration module for the AI-Powered Knowledge Base System.
 """
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 # Base paths
@@ -72,4 +73,30 @@ MARKDOWN_ROOT_PATH = os.getenv(
 )
 
 # Logging Configuration
-LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
+# INFO by default: DEBUG ships an order of magnitude more log volume and is
+# opt-in via the environment.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Request-path tunables, read from the environment exactly once.
+
+    Frozen + slots: immutable after startup (no races when env changes mid
+    process) with cheap attribute access; hot paths should read
+    SETTINGS.<field> instead of calling os.getenv per request.
+    """
+
+    top_k: int
+    max_token_for_text_unit: int
+    max_token_for_global_context: int
+    max_token_for_local_context: int
+
+
+SETTINGS = Settings(
+    top_k=int(os.getenv("TOP_K", "60")),
+    max_token_for_text_unit=int(os.getenv("MAX_TOKEN_TEXT_CHUNK", "4000")),
+    max_token_for_global_context=int(os.getenv("MAX_TOKEN_RELATION_DESC", "4000")),
+    max_token_for_local_context=int(os.getenv("MAX_TOKEN_ENTITY_DESC", "4000")),
+)
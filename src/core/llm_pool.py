@@ -0,0 +1,50 @@
+"""
+Shared LiteLlm instances for the AI-Powered Knowledge Base System.
+
+Each `LiteLlm(model=...)` construction carries its own HTTP session state, so
+building one per agent (or per request) forfeits connection pooling and pays
+a fresh TCP+TLS handshake on first use. This module hands out one LiteLlm
+per model string and points LiteLLM at a single pooled httpx session shared
+across every agent.
+"""
+
+import threading
+from typing import Dict
+
+from google.adk.models.lite_llm import LiteLlm
+
+from src.core.logger import logger
+
+_LITELLM_CACHE: Dict[str, LiteLlm] = {}
+_cache_lock = threading.Lock()
+_session_configured = False
+
+
+def _configure_shared_session():
+    """Point litellm at pooled httpx clients reused across all calls."""
+    global _session_configured
+    if _session_configured:
+        return
+    _session_configured = True
+    try:
+        import httpx
+        import litellm
+
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        litellm.client_session = httpx.Client(limits=limits)
+        litellm.aclient_session = httpx.AsyncClient(limits=limits)
+    except Exception as e:  # pragma: no cover
+        logger.warning(f"Could not configure shared LiteLLM HTTP session: {e}")
+
+
+def get_litellm(model: str) -> LiteLlm:
+    """Return the process-wide LiteLlm instance for a model string."""
+    llm = _LITELLM_CACHE.get(model)
+    if llm is None:
+        with _cache_lock:
+            llm = _LITELLM_CACHE.get(model)
+            if llm is None:
+                _configure_shared_session()
+                llm = LiteLlm(model=model)
+                _LITELLM_CACHE[model] = llm
+    return llm
@@ -9,8 +9,12 @@ from src.core.config import LOG_LEVEL
 # Remove default logger
 logger.remove()
 
-# Add stderr handler with the configured log level
-logger.add(sys.stderr, level=LOG_LEVEL)
+# Add stderr handler with the configured log level. enqueue=True moves the
+# actual write to a background thread so the event loop never blocks on
+# stderr; backtrace/diagnose off keeps exception formatting cheap.
+logger.add(
+    sys.stderr, level=LOG_LEVEL, enqueue=True, backtrace=False, diagnose=False
+)
 
 # Optionally add file logging for production environments
 # logger.add("logs/kb_system_{time}.log", rotation="10 MB", level=LOG_LEVEL)
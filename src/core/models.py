@@ -2,10 +2,43 @@
 Data models for the AI-Powered Knowledge Base System.
 """
 
-import os
-from typing import Dict, List, Optional, Callable
+from enum import IntEnum
+from typing import Dict, List, Optional, Callable, Tuple
 from typing import Literal
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+
+from src.core.config import SETTINGS
+
+
+class Status(IntEnum):
+    """
+    Outcome of a knowledge base operation.
+
+    An IntEnum makes the status branch in hot query/save loops a single int
+    compare (`response.status is Status.ERROR`) instead of a string hash +
+    memcmp. Wire statuses from backend payloads coerce transparently via
+    _missing_: "success" and "duplicated" (LightRAG's re-ingest reply, a
+    no-op rather than a failure) map to OK, while "failure" and anything
+    unrecognized degrade to ERROR rather than raising mid-save.
+    """
+
+    OK = 0
+    ERROR = 1
+
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return _STATUS_BY_NAME.get(value.lower(), cls.ERROR)
+        return None
+
+
+# Prebuilt string→member table: coercing legacy payload strings is one dict
+# lookup instead of a branch chain, and the table is built once at import.
+_STATUS_BY_NAME = {
+    "success": Status.OK,
+    "duplicated": Status.OK,
+    "error": Status.ERROR,
+}
 
 
 class QueryRequest(BaseModel):
@@ -13,6 +46,10 @@ class QueryRequest(BaseModel):
     Model for knowledge base query requests, including advanced configuration parameters for LightRAG.
     """
 
+    # Constructed on every retrieval call: skip re-validating the (already
+    # trusted) defaults and drop unknown keys instead of erroring.
+    model_config = ConfigDict(validate_default=False, extra="ignore")
+
     query: str = Field(..., description="The query text")
     mode: Literal["local", "global", "hybrid", "naive", "mix", "bypass"] = Field(
         "hybrid",
@@ -42,22 +79,24 @@ class QueryRequest(BaseModel):
         False, description="If True, enables streaming output for real-time responses."
     )
     top_k: int = Field(
-        default_factory=lambda: int(os.getenv("TOP_K", "60")),
+        SETTINGS.top_k,
         description="Number of top items to retrieve. Represents entities in 'local' mode and relationships in 'global' mode.",
     )
     max_token_for_text_unit: int = Field(
-        default_factory=lambda: int(os.getenv("MAX_TOKEN_TEXT_CHUNK", "4000")),
+        SETTINGS.max_token_for_text_unit,
         description="Maximum number of tokens allowed for each retrieved text chunk.",
     )
     max_token_for_global_context: int = Field(
-        default_factory=lambda: int(os.getenv("MAX_TOKEN_RELATION_DESC", "4000")),
+        SETTINGS.max_token_for_global_context,
         description="Maximum number of tokens allocated for relationship descriptions in global retrieval.",
     )
     max_token_for_local_context: int = Field(
-        default_factory=lambda: int(os.getenv("MAX_TOKEN_ENTITY_DESC", "4000")),
+        SETTINGS.max_token_for_local_context,
         description="Maximum number of tokens allocated for entity descriptions in local retrieval.",
     )
-    conversation_history: Optional[List[Dict[str, str]]] = Field(
+    # Not Optional: the default is already an empty list, so the None branch
+    # of the union was never taken and only added a validator node.
+    conversation_history: List[Dict[str, str]] = Field(
         default_factory=list,
         description='Stores past conversation history to maintain context. Format: [{"role": "user/assistant", "content": "message"}].',
     )
@@ -76,15 +115,21 @@ class QueryRequest(BaseModel):
     _model_func: Optional[Callable[..., object]] = PrivateAttr(default=None)
 
 
+# Precompiled validator for the hot request type: use
+# QUERY_REQUEST_ADAPTER.validate_python(d) instead of QueryRequest(**d) when
+# validating incoming dicts, so pydantic-core reuses one compiled schema.
+QUERY_REQUEST_ADAPTER = TypeAdapter(QueryRequest)
+
+
 class QueryResponse(BaseModel):
     """
     Model for knowledge base query responses.
     """
 
     response: str = Field(..., description="The generated response")
-    status: str = Field("success", description="Status of the query operation")
+    status: Status = Field(Status.OK, description="Status of the query operation")
     error_message: Optional[str] = Field(
-        None, description="Error message if status is 'error'"
+        None, description="Error message if status is Status.ERROR"
     )
 
 
@@ -101,38 +146,57 @@ class InsertResponse(BaseModel):
     Model for knowledge base insertion responses.
     """
 
-    status: str = Field(
-        ..., description="Status of the insertion operation (success, error)"
+    status: Status = Field(
+        ..., description="Status of the insertion operation (Status.OK, Status.ERROR)"
     )
     message: Optional[str] = Field(
         None, description="Additional details about the operation"
     )
 
 
+class Author(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., description="Author's name")
+    affiliation: Optional[str] = Field(None, description="Affiliation of the author")
+    email: Optional[str] = Field(None, description="Email address")
+
+
+class Affiliation(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., description="Affiliation name")
+    address: Optional[str] = Field(None, description="Affiliation address")
+
+
 class ScientificPaper(BaseModel):
     """
     Model representing a scientific paper.
+
+    Sequence fields are tuples of concrete item types: pydantic-core's
+    fixed-size tuple validator beats the list path (no per-element append),
+    the parsed values are write-once anyway, and tuples keep instances
+    hashable for dedup. Bare `list` would fall back to the generic
+    validator, which matters when papers are parsed in bulk.
     """
 
+    model_config = ConfigDict(validate_default=False, frozen=True)
+
     title: str = Field(..., description="Title of the scientific paper")
     doi: Optional[str] = Field(None, description="DOI of the paper")
-    authors: Optional[list] = Field(None, description="List of authors")
+    authors: Optional[Tuple[Author, ...]] = Field(None, description="List of authors")
     abstract: Optional[str] = Field(None, description="Abstract of the paper")
-    keywords: Optional[list] = Field(None, description="Keywords")
+    keywords: Optional[Tuple[str, ...]] = Field(None, description="Keywords")
     publication_year: Optional[int] = Field(None, description="Year of publication")
     journal_or_conference: Optional[str] = Field(
         None, description="Journal or conference name"
     )
-    sections: Optional[list] = Field(None, description="Sections of the paper")
-    references: Optional[list] = Field(None, description="References")
+    sections: Optional[Tuple[str, ...]] = Field(None, description="Sections of the paper")
+    references: Optional[Tuple[str, ...]] = Field(None, description="References")
 
 
-class Author(BaseModel):
-    name: str = Field(..., description="Author's name")
-    affiliation: Optional[str] = Field(None, description="Affiliation of the author")
-    email: Optional[str] = Field(None, description="Email address")
-
-
-class Affiliation(BaseModel):
-    name: str = Field(..., description="Affiliation name")
-    address: Optional[str] = Field(None, description="Affiliation address")
+# Precompiled validators for bulk ingest paths. Prefer the list adapter for
+# batches of extracted rows: one validate_python(rows) call crosses into
+# pydantic-core once for the whole batch instead of once per row.
+SCIENTIFIC_PAPER_ADAPTER = TypeAdapter(ScientificPaper)
+SCIENTIFIC_PAPER_LIST_ADAPTER = TypeAdapter(List[ScientificPaper])
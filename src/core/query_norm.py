@@ -0,0 +1,16 @@
+"""
+Query normalization for the AI-Powered Knowledge Base System.
+
+Trivial variations of the same question ("what is X?" vs "What is  X") break
+both the semantic response cache and provider prompt-prefix caches, which
+only match exactly. Normalizing queries before they enter prompt assembly or
+cache keys widens the hit surface at zero cost; keep the original text for
+display-only fields.
+"""
+
+import unicodedata
+
+
+def normalize(query: str) -> str:
+    """Canonical form of a query: NFC unicode, lowercased, whitespace collapsed."""
+    return unicodedata.normalize("NFC", " ".join(query.lower().split()))
@@ -5,18 +5,57 @@ This module provides an interface to the Knowledge Base Service for scientific p
 abstracting the underlying storage mechanisms (Knowledge Graph and Markdown).
 """
 
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Optional
 
 from src.core.logger import logger
+from src.core.models import Status
+from src.core.query_norm import normalize
 from src.kb_service.graph_module import KnowledgeGraphModule
 from src.kb_service.markdown_module import MarkdownModule
+from src.kb_service.semantic_cache import semantic_cache
+
+# How long an interactive query waits on the knowledge graph before falling
+# back to markdown results. Graph traversal plus LLM synthesis runs in the
+# seconds range, so most deep queries will miss this budget — the graph answer
+# is still collected in the background and cached for the next ask.
+GRAPH_TAIL_BUDGET = float(os.getenv("GRAPH_TAIL_BUDGET_SECONDS", "0.2"))
+
+# Micro-batching window for concurrent async queries: calls arriving within
+# this window are coalesced into one backend round trip.
+BATCH_WINDOW = 0.02  # seconds
+MAX_BATCH = 8
+
+# Process-wide service instances keyed by backend configuration. Constructing
+# the service is expensive (graph client, LLM/embedder cold start), and
+# per-request worker patterns would otherwise rebuild it every call.
+_INSTANCES: dict = {}
+_INSTANCES_LOCK = threading.Lock()
 
 
 class KnowledgeBaseService:
     """
     Knowledge Base Service for managing and accessing scientific paper knowledge.
+
+    Instances are memoized per backend configuration: constructing the
+    service twice with the same arguments returns the same object, so every
+    caller shares one graph client and one markdown module.
     """
 
+    def __new__(cls, backend: Optional[str] = None, **backend_kwargs):
+        key = (backend, tuple(sorted(backend_kwargs.items())))
+        with _INSTANCES_LOCK:
+            instance = _INSTANCES.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                _INSTANCES[key] = instance
+        return instance
+
     def __init__(self, backend: Optional[str] = None, **backend_kwargs):
         """
         Initialize the Knowledge Base Service.
@@ -25,12 +64,63 @@ class KnowledgeBaseService:
             backend: The knowledge graph backend to use ("light_rag" or "graphiti")
             **backend_kwargs: Additional keyword arguments for the backend
         """
-        self.graph_module = KnowledgeGraphModule(backend=backend, **backend_kwargs)
-        self.markdown_module = MarkdownModule()
+        # __init__ runs again whenever the cached instance is re-requested;
+        # the real construction must only happen once.
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+        # Backend construction is deferred to the cached properties below:
+        # pure-query workers never pay markdown init, and read-only markdown
+        # consumers never pay the graph client cold start.
+        self._backend = backend
+        self._backend_kwargs = backend_kwargs
+        # The graph and markdown backends are independent; a two-worker pool
+        # lets the sync save path run both writes concurrently.
+        self._save_executor = ThreadPoolExecutor(max_workers=2)
+        # Graph queries are orders of magnitude slower than any other call in
+        # this service; they run on a dedicated pool so a burst of deep
+        # queries cannot starve saves or fast markdown lookups.
+        self._slow_pool = ThreadPoolExecutor(max_workers=4)
+        # Fast pool for markdown prefetches that hide behind graph latency.
+        self._fast_pool = ThreadPoolExecutor(max_workers=8)
+        # Lazily created on the first async query: the queue and its consumer
+        # task must be bound to the running event loop.
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_consumer_task: Optional[asyncio.Task] = None
+        # The graph backend opens Neo4j/LLM connections, which can take
+        # seconds; warm it up off-thread so the first request doesn't pay
+        # for it. query_knowledge serves markdown fallbacks until the event
+        # is set.
+        self._graph_ready = threading.Event()
+        threading.Thread(
+            target=self._init_graph, name="kb-graph-warmup", daemon=True
+        ).start()
+
+        logger.info("Initialized Knowledge Base Service (backends load lazily)")
 
+    def _init_graph(self) -> None:
+        try:
+            self.graph_module
+        except Exception as e:
+            # Leave the module unbuilt; the cached property retries on the
+            # next access, and queries are merely gated, not failed.
+            logger.error(f"Graph backend warm-up failed: {e}")
+        finally:
+            self._graph_ready.set()
+
+    @functools.cached_property
+    def graph_module(self) -> KnowledgeGraphModule:
+        """Knowledge graph module, constructed on first graph operation."""
+        module = KnowledgeGraphModule(backend=self._backend, **self._backend_kwargs)
         logger.info(
-            f"Initialized Knowledge Base Service with {self.graph_module.backend_name} backend"
+            f"Knowledge Base Service using {module.backend_name} graph backend"
         )
+        return module
+
+    @functools.cached_property
+    def markdown_module(self) -> MarkdownModule:
+        """Markdown storage module, constructed on first markdown operation."""
+        return MarkdownModule()
 
     def query_knowledge(self, text: str) -> str:
         """
@@ -42,13 +132,173 @@ class KnowledgeBaseService:
         Returns:
             The response from the knowledge base
         """
-        logger.info(f"Querying knowledge base with: {text[:50]}...")
-        response = self.graph_module.query(text)
-        if response.status == "error":
+        # lazy=True defers the slice until a handler actually accepts the
+        # record, so it costs nothing when the level filters it out
+        logger.opt(lazy=True).info(
+            "Querying knowledge base with: {}...", lambda: text[:50]
+        )
+        # The normalized form feeds both cache keys and the backend prompt so
+        # trivial variations ("What is  X?" vs "what is x?") hit the same
+        # cache entries; the raw text stays available for display.
+        text = normalize(text)
+        # Repeat (or near-repeat) queries short-circuit here without touching
+        # the graph backend or any LLM.
+        cached = semantic_cache.get(text)
+        if cached is not None:
+            return cached
+        # A cold worker's graph backend may still be warming up; don't queue
+        # behind its construction, answer from markdown until it is ready.
+        if not self._graph_ready.wait(timeout=GRAPH_TAIL_BUDGET):
+            logger.info("Graph backend still warming up; serving markdown fallback")
+            return self._markdown_fallback(text)
+        # The graph traversal runs on the slow pool with a tail budget: if it
+        # answers in time the caller gets the deep result, otherwise we return
+        # a markdown-derived answer immediately and let the graph future
+        # populate the cache in the background for the next ask.
+        future = self._slow_pool.submit(self.graph_module.query, text)
+        # Prefetch the markdown bodies of any papers the query names while
+        # the graph traversal runs: if the graph misses its budget the
+        # fallback answer is already in memory, and if it answers in time the
+        # pending fetches are cancelled at near-zero cost.
+        prefetched = {
+            title: self._fast_pool.submit(
+                self.markdown_module.get_paper, paper_title=title
+            )
+            for title in self._matching_titles(text)[:4]
+        }
+        try:
+            response = future.result(timeout=GRAPH_TAIL_BUDGET)
+        except FutureTimeoutError:
+            future.add_done_callback(
+                lambda f, text=text: self._cache_graph_result(text, f)
+            )
+            logger.info(
+                f"Graph query exceeded {GRAPH_TAIL_BUDGET}s budget; "
+                "serving markdown fallback"
+            )
+            return self._markdown_fallback(text, prefetched)
+        for pending in prefetched.values():
+            pending.cancel()
+        if response.status is Status.ERROR:
+            logger.error(f"Error querying knowledge base: {response.error_message}")
+            return f"Error: {response.error_message}"
+        semantic_cache.put(text, response.response)
+        return response.response
+
+    def _cache_graph_result(self, text: str, future) -> None:
+        """Store a late graph answer in the cache so the next ask hits it."""
+        try:
+            response = future.result()
+        except Exception as e:
+            logger.warning(f"Background graph query failed: {e}")
+            return
+        if response.status is not Status.ERROR:
+            semantic_cache.put(text, response.response)
+
+    def _matching_titles(self, text: str) -> list:
+        """Stored paper titles that share at least one word with the query."""
+        words = set(text.split())
+        return [
+            title
+            for title in self.markdown_module.list_papers()
+            if words & set(title.replace("_", " ").split())
+        ]
+
+    def _markdown_fallback(self, text: str, prefetched: Optional[dict] = None) -> str:
+        """
+        Best-effort answer from the markdown store while the graph is busy:
+        papers whose titles share a word with the query, with the first
+        match's content inline (already in flight when it was prefetched).
+        """
+        matches = (
+            list(prefetched) if prefetched else self._matching_titles(text)
+        )
+        if not matches:
+            return (
+                "The knowledge graph is still processing this query; "
+                "no matching papers were found in the markdown store. "
+                "Please retry shortly for the full answer."
+            )
+        if prefetched:
+            content = prefetched[matches[0]].result()
+            for title in matches[1:]:
+                prefetched[title].cancel()
+        else:
+            content = self.markdown_module.get_paper(paper_title=matches[0])
+        listing = ", ".join(matches)
+        return (
+            f"Partial answer while the knowledge graph finishes "
+            f"(matching papers: {listing}):\n\n{content}"
+        )
+
+    async def async_query_knowledge(self, text: str) -> str:
+        """
+        Async counterpart of query_knowledge that coalesces concurrent calls.
+
+        Queries arriving within a 20 ms window share one backend round trip
+        (see KnowledgeGraphModule.batch_query), so N concurrent callers pay
+        roughly one graph traversal instead of N.
+
+        Args:
+            text: The query text
+
+        Returns:
+            The response from the knowledge base
+        """
+        text = normalize(text)
+        cached = await semantic_cache.aget(text)
+        if cached is not None:
+            return cached
+        response = await self._batched_query(text)
+        if response.status is Status.ERROR:
             logger.error(f"Error querying knowledge base: {response.error_message}")
             return f"Error: {response.error_message}"
+        semantic_cache.put(text, response.response)
         return response.response
 
+    async def _batched_query(self, text: str):
+        """Enqueue a query and await its fanned-out response."""
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_consumer_task = asyncio.create_task(self._drain_batches())
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((text, future))
+        return await future
+
+    async def _drain_batches(self) -> None:
+        """
+        Single consumer for the query queue: collect up to MAX_BATCH items or
+        BATCH_WINDOW seconds (whichever first), issue one combined backend
+        call, then fan the answers back out to the waiting futures.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._batch_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            texts = [text for text, _ in batch]
+            try:
+                responses = await asyncio.to_thread(
+                    self.graph_module.batch_query, texts
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+
     def save_paper(
         self,
         text: str,
@@ -69,25 +319,150 @@ class KnowledgeBaseService:
         Returns:
             True if the text was saved successfully, False otherwise
         """
-        logger.info(
-            f"Saving scientific paper '{paper_title}' to knowledge base: {text[:50]}..."
+        # No-op saves (both flags off) exit before paying for logging or the
+        # executor round trip.
+        if not (is_save_to_graph or is_save_to_markdown):
+            return True
+        logger.opt(lazy=True).info(
+            "Saving scientific paper '{}' to knowledge base: {}...",
+            lambda: paper_title,
+            lambda: text[:50],
         )
+        # The two backends never touch the same storage, so both writes run
+        # concurrently and the total latency is max(graph, markdown) instead
+        # of their sum.
+        futures = []
         if is_save_to_graph:
-            response = self.graph_module.save(
-                text=text, name=paper_title, domain="scientific_paper", doi=doi
+            futures.append(
+                self._save_executor.submit(self._save_to_graph, text, paper_title, doi)
             )
-            if response.status == "error":
-                logger.error(f"Error saving to knowledge graph: {response.message}")
-                return False
         if is_save_to_markdown:
-            markdown_result = self.markdown_module.save(
-                text=text, paper_title=paper_title, doi=doi
+            futures.append(
+                self._save_executor.submit(
+                    self._save_to_markdown, text, paper_title, doi
+                )
             )
-            if not markdown_result:
+        # Drain every future before returning so a failed write can't leave
+        # the other one orphaned in the pool.
+        if not all([future.result() for future in futures]):
+            return False
+        # New knowledge can change any answer; drop cached responses.
+        semantic_cache.invalidate()
+        return True
+
+    def _save_to_graph(self, text: str, paper_title: str, doi: str) -> bool:
+        response = self.graph_module.save(
+            text=text, name=paper_title, domain="scientific_paper", doi=doi
+        )
+        if response.status is Status.ERROR:
+            logger.error(f"Error saving to knowledge graph: {response.message}")
+            return False
+        return True
+
+    def _save_to_markdown(self, text: str, paper_title: str, doi: str) -> bool:
+        if not self.markdown_module.save(text=text, paper_title=paper_title, doi=doi):
+            logger.error("Error saving to markdown files")
+            return False
+        return True
+
+    async def async_save_paper(
+        self,
+        text: str,
+        paper_title: str,
+        doi: str = "",
+        is_save_to_markdown: bool = True,
+        is_save_to_graph: bool = True,
+    ) -> bool:
+        """
+        Async counterpart of save_paper: the graph and markdown writes are
+        awaited concurrently instead of back to back.
+
+        Args:
+            text: The text to save
+            paper_title: The title of the scientific paper
+            doi: The DOI of the paper (optional)
+            is_save_to_markdown: Whether to save to markdown files
+            is_save_to_graph: Whether to save to the knowledge graph
+        Returns:
+            True if the text was saved successfully, False otherwise
+        """
+        if not (is_save_to_graph or is_save_to_markdown):
+            return True
+        logger.opt(lazy=True).info(
+            "Async saving scientific paper '{}' to knowledge base: {}...",
+            lambda: paper_title,
+            lambda: text[:50],
+        )
+        tasks = []
+        if is_save_to_graph:
+            tasks.append(
+                self.graph_module.async_save(
+                    text=text, name=paper_title, domain="scientific_paper"
+                )
+            )
+        if is_save_to_markdown:
+            # The markdown save is blocking file I/O; run it in a thread so it
+            # overlaps with the graph write.
+            tasks.append(
+                asyncio.to_thread(
+                    self.markdown_module.save,
+                    text=text,
+                    paper_title=paper_title,
+                    doi=doi,
+                )
+            )
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error saving scientific paper: {result}")
+                return False
+            if not result:
                 logger.error("Error saving to markdown files")
                 return False
+        semantic_cache.invalidate()
         return True
 
+    async def async_save_papers(
+        self, papers: list, max_concurrency: int = 16
+    ) -> list:
+        """
+        Save a batch of scientific papers concurrently.
+
+        Graph saves are LLM-backed (entity extraction), so bulk ingest is
+        latency-bound rather than CPU-bound: running the saves under a
+        semaphore gives near-linear speedup up to the backend's rate limit.
+
+        Args:
+            papers: Dicts of save_paper keyword arguments, one per paper
+                (text, paper_title, and optionally doi,
+                is_save_to_markdown, is_save_to_graph)
+            max_concurrency: Maximum number of saves in flight at once
+
+        Returns:
+            One bool per paper, in order; failures (including raised
+            exceptions) come back as False rather than aborting the batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _save_one(paper: dict) -> bool:
+            async with semaphore:
+                return await self.async_save_paper(**paper)
+
+        results = await asyncio.gather(
+            *[_save_one(paper) for paper in papers], return_exceptions=True
+        )
+        statuses = []
+        for paper, result in zip(papers, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error saving scientific paper "
+                    f"'{paper.get('paper_title')}': {result}"
+                )
+                statuses.append(False)
+            else:
+                statuses.append(result)
+        return statuses
+
     def get_paper(self, paper_title: str, doi: str = "") -> str:
         """
         Get a scientific paper from markdown files.
@@ -98,7 +473,11 @@ class KnowledgeBaseService:
         Returns:
             The content of the markdown file
         """
-        logger.info(f"Getting scientific paper '{paper_title}' (DOI: {doi})")
+        logger.opt(lazy=True).info(
+            "Getting scientific paper '{}' (DOI: {})",
+            lambda: paper_title,
+            lambda: doi,
+        )
         return self.markdown_module.get_paper(paper_title=paper_title, doi=doi)
 
     def list_papers(self) -> list:
@@ -121,5 +500,9 @@ class KnowledgeBaseService:
         Returns:
             True if the deletion was successful, False otherwise
         """
-        logger.info(f"Deleting scientific paper '{paper_title}' (DOI: {doi})")
+        logger.opt(lazy=True).info(
+            "Deleting scientific paper '{}' (DOI: {})",
+            lambda: paper_title,
+            lambda: doi,
+        )
         return self.markdown_module.delete(paper_title=paper_title, doi=doi)
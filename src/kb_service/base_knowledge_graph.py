@@ -4,14 +4,42 @@ Base Knowledge Graph interface for Scientific Paper Knowledge Base System.
 This module defines the abstract base class that all scientific paper knowledge graph implementations must follow.
 """
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional
 
 from src.core.models import (
     QueryResponse,
     InsertResponse,
+    Status,
 )
 
+# Shared event loop for the sync default implementations below. Running one
+# loop forever on a daemon thread avoids the per-call cost of asyncio.run
+# (new loop + teardown each time) and lets sync callers coexist with async
+# callers on the same backend connections.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="kb-graph-loop", daemon=True
+                ).start()
+                _loop = loop
+    return _loop
+
+
+def _run_sync(coro):
+    """Run a coroutine on the shared background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
 
 class BaseKnowledgeGraph(ABC):
     """
@@ -19,13 +47,19 @@ class BaseKnowledgeGraph(ABC):
 
     This class defines the interface that all scientific paper knowledge graph backends must implement,
     ensuring a consistent API regardless of the underlying technology.
+
+    Only the async methods are abstract: the sync `query`/`save` default to
+    dispatching their async counterparts onto a shared background event loop,
+    so backends that are async-native need not write blocking wrappers.
     """
 
-    @abstractmethod
     def query(self, query_text: str, mode: str = "local", **kwargs) -> QueryResponse:
         """
         Query the knowledge graph for scientific papers with the given text.
 
+        Default implementation delegates to async_query on the shared
+        background loop; backends may override with a native sync path.
+
         Args:
             query_text: The query text
             mode: Query mode (local, global, hybrid, naive, mix, bypass)
@@ -34,7 +68,11 @@ class BaseKnowledgeGraph(ABC):
         Returns:
             QueryResponse object containing the response from the knowledge graph
         """
-        pass
+        try:
+            response = _run_sync(self.async_query(query_text, mode, **kwargs))
+            return QueryResponse(response=response, status=Status.OK)
+        except Exception as e:
+            return QueryResponse(response="", status=Status.ERROR, error_message=str(e))
 
     @abstractmethod
     async def async_query(self, query_text: str, mode: str = "local", **kwargs) -> str:
@@ -51,13 +89,15 @@ class BaseKnowledgeGraph(ABC):
         """
         pass
 
-    @abstractmethod
     def save(
         self, text: str, paper_title: Optional[str] = None, doi: str = ""
     ) -> InsertResponse:
         """
         Save the given scientific paper text to the knowledge graph.
 
+        Default implementation delegates to async_save on the shared
+        background loop; backends may override with a native sync path.
+
         Args:
             text: The text to save
             paper_title: Optional title of the scientific paper
@@ -66,7 +106,11 @@ class BaseKnowledgeGraph(ABC):
         Returns:
             InsertResponse object indicating success or failure
         """
-        pass
+        try:
+            result = _run_sync(self.async_save(text, paper_title, doi))
+            return InsertResponse(status=Status.OK, message=str(result))
+        except Exception as e:
+            return InsertResponse(status=Status.ERROR, message=str(e))
 
     @abstractmethod
     async def async_save(
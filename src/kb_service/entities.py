@@ -1,122 +1,360 @@
-from pydantic import BaseModel, Field
+import sys
+from functools import lru_cache
+from typing import Annotated
+
+import msgspec
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+)
+
+# Bounded string types for the entity fields: constraints known at schema
+# build time take pydantic-core's fast string path, and the caps stop a
+# runaway hallucinated value (a multi-megabyte "description") from being
+# allocated and carried through ingest.
+_Name = Annotated[str, StringConstraints(strip_whitespace=True, max_length=512)]
+_Identifier = Annotated[str, StringConstraints(strip_whitespace=True, max_length=128)]
+_Text = Annotated[str, StringConstraints(strip_whitespace=True, max_length=65536)]
+
+
+@lru_cache(maxsize=None)
+def list_adapter(cls: type) -> TypeAdapter:
+    """
+    Compiled TypeAdapter for list[cls], built once per type and reused
+    forever. Go through this instead of constructing TypeAdapter(list[...])
+    at call sites, which would rebuild the schema every time; it also keeps
+    the deferred entity schemas unbuilt until a batch actually validates.
+    """
+    return TypeAdapter(list[cls])
+
+# Author names, affiliations, journals, and keywords recur across thousands
+# of papers; interning them makes every model share one str object per
+# distinct value, shrinking the string heap and turning equality checks into
+# pointer compares.
+_INTERN: dict[str, str] = {}
+
+
+def _intern(value: str) -> str:
+    return _INTERN.setdefault(value, sys.intern(value))
+
+
+def free_intern_table() -> None:
+    """Release the intern table, e.g. between bulk-ingest jobs."""
+    _INTERN.clear()
+
+
+def to_json(obj) -> bytes:
+    """
+    Serialize an entity (pydantic model or Struct twin) straight to JSON
+    bytes in C, skipping pydantic's Python encoder and the str→utf-8 round
+    trip; write the result directly to disk or the wire.
+    """
+    if isinstance(obj, msgspec.Struct):
+        return msgspec.json.encode(obj)
+    return orjson.dumps(obj.model_dump(mode="python"), option=orjson.OPT_NON_STR_KEYS)
+
+
+# Shared description builder for the link-style list fields below. The four
+# "List of X (link to Y nodes)" literals differed only in their nouns; one
+# f-string template keeps a single copy of the shared text in the module and
+# in every generated schema.
+def _link_desc(items: str, node: str) -> str:
+    return f"List of {items} (link to {node} nodes)."
+
 
 # --- Scientific Paper Entities ---
 
 
-class ScientificPaper(BaseModel):
+class _Entity(BaseModel):
+    """
+    Shared base for the paper entity models: one ConfigDict instance (and
+    one schema-config identity, which pydantic-core's prebuilt-validator
+    reuse keys on) instead of nine per-class copies.
+    """
+
+    # extra="ignore": LLM extraction output routinely carries stray keys
+    # (intermediate reasoning fields); dropping them is cheaper than the
+    # forbid error path and keeps ingest from failing on harmless noise.
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=True)
+
+    @classmethod
+    def from_json_bytes(cls, raw: bytes):
+        """
+        Validate straight from JSON bytes: pydantic's jiter parser consumes
+        the buffer in Rust, skipping the json.loads() → dict → validate
+        round trip. Pass bytes, not str, to avoid a re-encode.
+        """
+        return cls.model_validate_json(raw)
+
+
+
+class ScientificPaper(_Entity):
     """
     Represents a scientific paper or publication.
     """
 
-    title: str = Field(..., description="The title of the scientific paper.")
-    abstract: str = Field(..., description="The abstract or summary of the paper.")
+
+    title: _Name = Field(..., description="The title of the scientific paper.")
+    abstract: _Text = Field(..., description="The abstract or summary of the paper.")
     publication_year: int = Field(..., description="The year the paper was published.")
-    doi: str = Field(
+    doi: _Identifier = Field(
         ..., description="The Digital Object Identifier (DOI) of the paper."
     )
-    authors: list[str] = Field(
-        ..., description="List of author names (link to Author nodes)."
+    authors: tuple[str, ...] = Field(
+        ..., description=_link_desc("author names", "Author")
     )
-    affiliations: list[str] = Field(
+    affiliations: tuple[str, ...] = Field(
         ...,
-        description="List of affiliations for the authors (link to Affiliation nodes).",
+        description=_link_desc("affiliations for the authors", "Affiliation"),
     )
-    keywords: list[str] = Field(
+    keywords: tuple[str, ...] = Field(
         ..., description="List of keywords describing the paper's topics."
     )
-    research_fields: list[str] = Field(
+    research_fields: tuple[str, ...] = Field(
         ..., description="List of research fields or domains relevant to the paper."
     )
-    sections: list[str] = Field(
+    sections: tuple[str, ...] = Field(
         ...,
-        description="List of section titles in the paper (link to PaperSection nodes).",
+        description=_link_desc("section titles in the paper", "PaperSection"),
     )
-    references: list[str] = Field(
+    references: tuple[str, ...] = Field(
         ...,
-        description="List of DOIs or titles of referenced papers (link to Reference nodes).",
+        description=_link_desc("DOIs or titles of referenced papers", "Reference"),
     )
-    conference_or_journal: str = Field(
+    conference_or_journal: _Name = Field(
         ...,
         description="The name of the conference or journal where the paper was published.",
     )
 
+    @field_validator(
+        "authors",
+        "affiliations",
+        "keywords",
+        "research_fields",
+        "references",
+        mode="after",
+    )
+    @classmethod
+    def _intern_items(cls, v) -> tuple[str, ...]:
+        return tuple(_intern(item) for item in v)
 
-class Author(BaseModel):
+
+class Author(_Entity):
     """
     Represents an author of a scientific paper.
     """
 
-    name: str = Field(..., description="Full name of the author.")
-    affiliation: str = Field(
+
+    name: _Name = Field(..., description="Full name of the author.")
+    affiliation: _Name = Field(
         ..., description="Affiliation of the author (link to Affiliation node)."
     )
-    orcid: str = Field(..., description="ORCID identifier for the author.")
+    orcid: _Identifier = Field(..., description="ORCID identifier for the author.")
 
 
-class Affiliation(BaseModel):
+class Affiliation(_Entity):
     """
     Represents an institution or organization affiliated with an author.
     """
 
-    name: str = Field(..., description="Name of the institution or organization.")
-    address: str = Field(..., description="Address of the institution.")
 
+    name: _Name = Field(..., description="Name of the institution or organization.")
+    address: _Name = Field(..., description="Address of the institution.")
 
-class PaperSection(BaseModel):
+
+class PaperSection(_Entity):
     """
     Represents a section within a scientific paper (e.g., Introduction, Methods, Results).
     """
 
-    section_title: str = Field(..., description="Title of the section.")
-    content: str = Field(..., description="Text content of the section.")
+
+    section_title: _Name = Field(..., description="Title of the section.")
+    content: _Text = Field(..., description="Text content of the section.")
 
 
-class Citation(BaseModel):
+class Citation(_Entity):
     """
     Represents a citation made by a scientific paper to another work.
     """
 
-    cited_paper_doi: str = Field(..., description="DOI of the cited paper.")
-    context: str = Field(
+
+    cited_paper_doi: _Identifier = Field(..., description="DOI of the cited paper.")
+    context: _Text = Field(
         ..., description="Textual context in which the citation appears."
     )
 
 
-class Reference(BaseModel):
+class Reference(_Entity):
     """
     Represents a reference entry in a scientific paper's bibliography.
     """
 
-    title: str = Field(..., description="Title of the referenced work.")
-    authors: list[str] = Field(
+
+    title: _Name = Field(..., description="Title of the referenced work.")
+    authors: tuple[str, ...] = Field(
         ..., description="List of authors of the referenced work."
     )
-    doi: str = Field(..., description="DOI of the referenced work.")
+    doi: _Identifier = Field(..., description="DOI of the referenced work.")
     publication_year: int = Field(..., description="Year of publication.")
 
+    @field_validator("authors", mode="after")
+    @classmethod
+    def _intern_items(cls, v) -> tuple[str, ...]:
+        return tuple(_intern(item) for item in v)
 
-class Keyword(BaseModel):
+
+class Keyword(_Entity):
     """
     Represents a keyword or topic associated with a scientific paper.
     """
 
-    keyword: str = Field(..., description="The keyword or topic.")
+
+    keyword: _Name = Field(..., description="The keyword or topic.")
 
 
-class ResearchField(BaseModel):
+class ResearchField(_Entity):
     """
     Represents a research field or domain relevant to a scientific paper.
     """
 
-    field_name: str = Field(..., description="Name of the research field.")
-    description: str = Field(..., description="Description of the research field.")
 
+    field_name: _Name = Field(..., description="Name of the research field.")
+    description: _Text = Field(..., description="Description of the research field.")
 
-class ConferenceOrJournal(BaseModel):
+
+class ConferenceOrJournal(_Entity):
     """
     Represents a conference or journal where a scientific paper is published.
     """
 
-    name: str = Field(..., description="Name of the conference or journal.")
-    issn_or_isbn: str = Field(..., description="ISSN or ISBN identifier.")
-    publisher: str = Field(..., description="Publisher of the conference or journal.")
+
+    name: _Name = Field(..., description="Name of the conference or journal.")
+    issn_or_isbn: _Identifier = Field(..., description="ISSN or ISBN identifier.")
+    publisher: _Name = Field(..., description="Publisher of the conference or journal.")
+
+
+# --- Wire-format structs ---
+#
+# Graphiti's entity extraction needs the pydantic models above (their Field
+# descriptions feed the extraction prompt), but decoding LLM JSON output
+# through pydantic is CPU-bound on the ingestion hot path. These Struct twins
+# (de)serialize in C with a slots layout; call .to_pydantic() where a
+# consumer needs the pydantic type.
+
+
+class ScientificPaperStruct(msgspec.Struct, frozen=True, gc=False):
+    title: str
+    abstract: str
+    publication_year: int
+    doi: str
+    authors: tuple[str, ...]
+    affiliations: tuple[str, ...]
+    keywords: tuple[str, ...]
+    research_fields: tuple[str, ...]
+    sections: tuple[str, ...]
+    references: tuple[str, ...]
+    conference_or_journal: str
+
+    def to_pydantic(self) -> ScientificPaper:
+        return ScientificPaper(**msgspec.structs.asdict(self))
+
+
+class AuthorStruct(msgspec.Struct, frozen=True, gc=False):
+    name: str
+    affiliation: str
+    orcid: str
+
+    def to_pydantic(self) -> Author:
+        return Author(**msgspec.structs.asdict(self))
+
+
+class AffiliationStruct(msgspec.Struct, frozen=True, gc=False):
+    name: str
+    address: str
+
+    def to_pydantic(self) -> Affiliation:
+        return Affiliation(**msgspec.structs.asdict(self))
+
+
+class PaperSectionStruct(msgspec.Struct, frozen=True, gc=False):
+    section_title: str
+    content: str
+
+    def to_pydantic(self) -> PaperSection:
+        return PaperSection(**msgspec.structs.asdict(self))
+
+
+class CitationStruct(msgspec.Struct, frozen=True, gc=False):
+    cited_paper_doi: str
+    context: str
+
+    def to_pydantic(self) -> Citation:
+        return Citation(**msgspec.structs.asdict(self))
+
+
+class ReferenceStruct(msgspec.Struct, frozen=True, gc=False):
+    title: str
+    authors: tuple[str, ...]
+    doi: str
+    publication_year: int
+
+    def to_pydantic(self) -> Reference:
+        return Reference(**msgspec.structs.asdict(self))
+
+
+class KeywordStruct(msgspec.Struct, frozen=True, gc=False):
+    keyword: str
+
+    def to_pydantic(self) -> Keyword:
+        return Keyword(**msgspec.structs.asdict(self))
+
+
+class ResearchFieldStruct(msgspec.Struct, frozen=True, gc=False):
+    field_name: str
+    description: str
+
+    def to_pydantic(self) -> ResearchField:
+        return ResearchField(**msgspec.structs.asdict(self))
+
+
+class ConferenceOrJournalStruct(msgspec.Struct, frozen=True, gc=False):
+    name: str
+    issn_or_isbn: str
+    publisher: str
+
+    def to_pydantic(self) -> ConferenceOrJournal:
+        return ConferenceOrJournal(**msgspec.structs.asdict(self))
+
+
+# --- Precompiled (de)coders ---
+#
+# The schemas are fixed at deploy time, so each entity gets one decoder built
+# at import: a single compiled state machine per shape instead of per-call
+# type dispatch. Prefer decode_paper(raw) over
+# ScientificPaper.model_validate_json(raw) on ingest hot paths (convert with
+# .to_pydantic() only where the pydantic type is required).
+
+_PAPER_DECODER = msgspec.json.Decoder(ScientificPaperStruct)
+_AUTHOR_DECODER = msgspec.json.Decoder(AuthorStruct)
+_AFFILIATION_DECODER = msgspec.json.Decoder(AffiliationStruct)
+_SECTION_DECODER = msgspec.json.Decoder(PaperSectionStruct)
+_CITATION_DECODER = msgspec.json.Decoder(CitationStruct)
+_REFERENCE_DECODER = msgspec.json.Decoder(ReferenceStruct)
+_KEYWORD_DECODER = msgspec.json.Decoder(KeywordStruct)
+_RESEARCH_FIELD_DECODER = msgspec.json.Decoder(ResearchFieldStruct)
+_CONFERENCE_DECODER = msgspec.json.Decoder(ConferenceOrJournalStruct)
+
+decode_paper = _PAPER_DECODER.decode
+decode_author = _AUTHOR_DECODER.decode
+decode_affiliation = _AFFILIATION_DECODER.decode
+decode_section = _SECTION_DECODER.decode
+decode_citation = _CITATION_DECODER.decode
+decode_reference = _REFERENCE_DECODER.decode
+decode_keyword = _KEYWORD_DECODER.decode
+decode_research_field = _RESEARCH_FIELD_DECODER.decode
+decode_conference_or_journal = _CONFERENCE_DECODER.decode
@@ -6,7 +6,8 @@ It supports multiple backend implementations (LightRAG and Graphiti) through a f
 """
 
 import os
-from typing import Optional, Literal
+import re
+from typing import List, Optional
 
 from src.core.config import (
     KNOWLEDGE_GRAPH_BACKEND,
@@ -16,6 +17,7 @@ from src.core.logger import logger
 from src.core.models import (
     QueryResponse,
     InsertResponse,
+    Status,
 )
 from src.kb_service.base_knowledge_graph import BaseKnowledgeGraph
 from src.kb_service.lightrag_backend import LightRAGKnowledgeGraph
@@ -23,6 +25,11 @@ from src.kb_service.graphiti_backend import GraphitiKnowledgeGraph
 
 from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
 
+# Accepted knowledge domains. A frozenset membership test is a single hashed
+# lookup on the save hot path, where typing.Literal annotations are never
+# checked at runtime anyway.
+_VALID_DOMAINS = frozenset({"scientific_paper"})
+
 
 class KnowledgeGraphModule:
     """
@@ -80,6 +87,57 @@ class KnowledgeGraphModule:
         logger.debug(f"Querying knowledge graph with: {query_text}")
         return self.backend.query(query_text, mode, **kwargs)
 
+    def batch_query(
+        self, query_texts: List[str], mode: str = "local", **kwargs
+    ) -> List[QueryResponse]:
+        """
+        Answer several queries in one backend round trip.
+
+        The queries are numbered and concatenated into a single prompt that
+        asks for delimiter-separated answers, so N concurrent callers pay one
+        graph traversal + LLM synthesis instead of N. Falls back to a plain
+        query for a batch of one.
+
+        Args:
+            query_texts: The query texts to answer
+            mode: Query mode (local, hybrid, or semantic)
+            **kwargs: Additional parameters for the query
+
+        Returns:
+            One QueryResponse per input query, in order
+        """
+        if len(query_texts) == 1:
+            return [self.query(query_texts[0], mode, **kwargs)]
+        logger.debug(f"Batch querying knowledge graph with {len(query_texts)} queries")
+        numbered = "\n\n".join(
+            f"QUESTION {i + 1}: {text}" for i, text in enumerate(query_texts)
+        )
+        combined = (
+            f"Answer each of the following {len(query_texts)} questions "
+            "independently. Separate the answers with a line containing "
+            "exactly '===ANSWER===' and keep them in question order.\n\n"
+            f"{numbered}"
+        )
+        response = self.query(combined, mode, **kwargs)
+        if response.status is Status.ERROR:
+            return [response] * len(query_texts)
+        answers = [
+            part.strip()
+            for part in re.split(r"\n?===ANSWER===\n?", response.response)
+            if part.strip()
+        ]
+        if len(answers) != len(query_texts):
+            # The model ignored the delimiter contract; re-run individually
+            # rather than hand callers misaligned answers.
+            logger.warning(
+                f"Batch query returned {len(answers)} answers for "
+                f"{len(query_texts)} queries; retrying individually"
+            )
+            return [self.query(text, mode, **kwargs) for text in query_texts]
+        return [
+            QueryResponse(response=answer, status=Status.OK) for answer in answers
+        ]
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_fixed(2),
@@ -109,7 +167,7 @@ class KnowledgeGraphModule:
         self,
         text: str,
         name: Optional[str] = None,
-        domain: Literal["scientific_paper"] = "scientific_paper",
+        domain: str = "scientific_paper",
     ) -> InsertResponse:
         """
         Save the given scientific paper text to the knowledge graph.
@@ -122,6 +180,8 @@ class KnowledgeGraphModule:
         Returns:
             InsertResponse object indicating success or failure
         """
+        if domain not in _VALID_DOMAINS:
+            raise ValueError(f"Unsupported knowledge domain: {domain}")
         logger.debug(
             f"Saving scientific paper text to knowledge graph: {text[:100]}..."
         )
@@ -131,7 +191,7 @@ class KnowledgeGraphModule:
         self,
         text: str,
         name: Optional[str] = None,
-        domain: Literal["scientific_paper"] = "scientific_paper",
+        domain: str = "scientific_paper",
     ) -> str:
         """
         Async implementation of the save method.
@@ -144,6 +204,8 @@ class KnowledgeGraphModule:
         Returns:
             The ID of the saved episode
         """
+        if domain not in _VALID_DOMAINS:
+            raise ValueError(f"Unsupported knowledge domain: {domain}")
         logger.debug(
             f"Async saving scientific paper text to knowledge graph: {text[:100]}..."
         )
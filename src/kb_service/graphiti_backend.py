@@ -28,6 +28,7 @@ from src.core.logger import logger
 from src.core.models import (
     QueryResponse,
     InsertResponse,
+    Status,
 )
 from src.kb_service.base_knowledge_graph import BaseKnowledgeGraph
 from src.kb_service.entities import (
@@ -212,13 +213,13 @@ class GraphitiKnowledgeGraph(BaseKnowledgeGraph):
             loop.close()
 
             return QueryResponse(
-                response=response_text, status="success", error_message=None
+                response=response_text, status=Status.OK, error_message=None
             )
 
         except Exception as e:
             error_msg = f"Error querying Graphiti knowledge graph: {str(e)}"
             logger.error(error_msg)
-            return QueryResponse(response="", status="error", error_message=error_msg)
+            return QueryResponse(response="", status=Status.ERROR, error_message=error_msg)
 
     async def async_query(self, query_text: str, mode: str = "global", **kwargs) -> str:
         """
@@ -433,11 +434,11 @@ class GraphitiKnowledgeGraph(BaseKnowledgeGraph):
             loop.close()
 
             return InsertResponse(
-                status="success",
+                status=Status.OK,
                 message=f"Successfully saved text to Graphiti knowledge graph with ID: {result}",
             )
 
         except Exception as e:
             error_msg = f"Error saving to Graphiti knowledge graph: {str(e)}"
             logger.error(error_msg)
-            return InsertResponse(status="error", message=error_msg)
+            return InsertResponse(status=Status.ERROR, message=error_msg)
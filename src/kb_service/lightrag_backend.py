@@ -20,6 +20,7 @@ from src.core.models import (
     QueryResponse,
     InsertTextRequest,
     InsertResponse,
+    Status,
 )
 from src.kb_service.base_knowledge_graph import BaseKnowledgeGraph
 
@@ -76,6 +77,10 @@ class LightRAGKnowledgeGraph(BaseKnowledgeGraph):
         self.headers = {}
         if self.api_key:
             self.headers["Authorization"] = f"Bearer {self.api_key}"
+        # Request bodies are serialized with pydantic-core's Rust serializer
+        # (model_dump_json) and sent pre-encoded, so the Content-Type must be
+        # set explicitly instead of relying on the json= kwarg.
+        self.json_headers = {**self.headers, "Content-Type": "application/json"}
 
     def query(self, query_text: str, mode: str = "local", **kwargs) -> QueryResponse:
         """
@@ -90,21 +95,23 @@ class LightRAGKnowledgeGraph(BaseKnowledgeGraph):
             QueryResponse object containing the response from the knowledge base
         """
         endpoint = f"{self.base_url}/query"
-        payload = QueryRequest(query=query_text, mode=mode, **kwargs).dict(
+        # model_dump_json serializes in Rust, skipping the .dict() +
+        # stdlib-json two-step the json= kwarg would do.
+        payload = QueryRequest(query=query_text, mode=mode, **kwargs).model_dump_json(
             exclude_none=True
         )
         logger.debug(f"Querying LightRAG knowledge graph with: {payload}")
         try:
-            response = requests.post(endpoint, json=payload, headers=self.headers)
+            response = requests.post(endpoint, data=payload, headers=self.json_headers)
             response.raise_for_status()
             data = response.json()
             return QueryResponse(
-                response=data.get("response", ""), status="success", error_message=None
+                response=data.get("response", ""), status=Status.OK, error_message=None
             )
         except requests.exceptions.RequestException as e:
             error_msg = f"Error querying LightRAG knowledge graph: {str(e)}"
             logger.error(error_msg)
-            return QueryResponse(response="", status="error", error_message=error_msg)
+            return QueryResponse(response="", status=Status.ERROR, error_message=error_msg)
 
     async def async_query(self, query_text: str, mode: str = "local", **kwargs) -> str:
         """
@@ -119,14 +126,14 @@ class LightRAGKnowledgeGraph(BaseKnowledgeGraph):
             The response text from the knowledge base
         """
         endpoint = f"{self.base_url}/query"
-        payload = QueryRequest(query=query_text, mode=mode, **kwargs).dict(
+        payload = QueryRequest(query=query_text, mode=mode, **kwargs).model_dump_json(
             exclude_none=True
         )
         logger.debug(f"Async querying LightRAG knowledge graph with: {payload}")
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(
-                    endpoint, json=payload, headers=self.headers
+                    endpoint, data=payload, headers=self.json_headers
                 ) as response:
                     response.raise_for_status()
                     data = await response.json()
@@ -151,22 +158,22 @@ class LightRAGKnowledgeGraph(BaseKnowledgeGraph):
             InsertResponse object indicating success or failure
         """
         endpoint = f"{self.base_url}/documents/text"
-        payload = InsertTextRequest(text=text).dict()
+        payload = InsertTextRequest(text=text).model_dump_json()
         logger.debug(
             f"Saving scientific paper text to LightRAG knowledge graph: {text[:100]}..."
         )
         try:
-            response = requests.post(endpoint, json=payload, headers=self.headers)
+            response = requests.post(endpoint, data=payload, headers=self.json_headers)
             response.raise_for_status()
             data = response.json()
             logger.debug(f"Received response: {data}")
             return InsertResponse(
-                status=data.get("status", "error"), message=data.get("message", "")
+                status=Status(data.get("status", "error")), message=data.get("message", "")
             )
         except requests.exceptions.RequestException as e:
             error_msg = f"Error saving to LightRAG knowledge graph: {str(e)}"
             logger.error(error_msg)
-            return InsertResponse(status="error", message=error_msg)
+            return InsertResponse(status=Status.ERROR, message=error_msg)
 
     async def async_save(
         self,
@@ -186,14 +193,14 @@ class LightRAGKnowledgeGraph(BaseKnowledgeGraph):
             The ID of the saved episode or a status message
         """
         endpoint = f"{self.base_url}/documents/text"
-        payload = InsertTextRequest(text=text).dict()
+        payload = InsertTextRequest(text=text).model_dump_json()
         logger.debug(
             f"Async saving scientific paper text to LightRAG knowledge graph: {text[:100]}..."
         )
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(
-                    endpoint, json=payload, headers=self.headers
+                    endpoint, data=payload, headers=self.json_headers
                 ) as response:
                     response.raise_for_status()
                     data = await response.json()
@@ -4,15 +4,21 @@ Markdown Storage Module for the AI-Powered Knowledge Base System.
 This module provides functionality for storing and retrieving knowledge as Markdown files.
 """
 
+import mmap
 import os
 import re
 import shutil
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional
 from datetime import datetime
 
 from src.core.config import MARKDOWN_ROOT_PATH
 from src.core.logger import logger
 
+# Capacity of the per-module mmap cache for recently read papers.
+_PAPER_CACHE_CAPACITY = 128
+
 
 class MarkdownModule:
     """
@@ -28,6 +34,22 @@ class MarkdownModule:
         """
         self.root_path = root_path or MARKDOWN_ROOT_PATH
 
+        # Listing cache: the root directory's mtime changes whenever a paper
+        # directory is added or removed, so a matching mtime means the cached
+        # listing is still valid and list_papers costs one stat call.
+        self._listing_cache: Optional[List[str]] = None
+        self._listing_mtime: float = 0.0
+
+        # LRU of memory-mapped paper files keyed by path: repeat reads of hot
+        # papers become memory hits instead of open/read syscalls. Entries
+        # carry the file's mtime so an on-disk update invalidates them.
+        # get_paper runs concurrently (the service's prefetch pool plus the
+        # request thread), so every lookup/insert/eviction — and the
+        # bytes() copy out of a mapping — happens under this lock; a racing
+        # eviction would otherwise close an mmap mid-copy.
+        self._paper_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._paper_cache_lock = threading.Lock()
+
         # Create the root directory if it doesn't exist
         os.makedirs(self.root_path, exist_ok=True)
 
@@ -64,6 +86,10 @@ class MarkdownModule:
             )
             with open(file_path, "w", encoding="utf-8") as file:
                 file.write(header + text)
+            # mtime resolution can miss sub-second changes; drop the listing
+            # and paper caches explicitly.
+            self._listing_mtime = 0.0
+            self._drop_cached_paper(file_path)
             logger.info(
                 f"Saved scientific paper knowledge for '{paper_title}' to {file_path}"
             )
@@ -91,8 +117,7 @@ class MarkdownModule:
             if not os.path.exists(file_path):
                 logger.warning(f"Markdown file not found: {file_path}")
                 return ""
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
+            content = self._read_paper(file_path)
             logger.info(
                 f"Retrieved scientific paper '{paper_title}' (DOI: {doi}) from {file_path}"
             )
@@ -103,6 +128,53 @@ class MarkdownModule:
             logger.error(error_msg)
             return ""
 
+    def _read_paper(self, file_path: str) -> str:
+        """
+        Read a paper file through the mmap LRU: a cache hit whose mtime still
+        matches the file on disk costs one stat plus a decode from mapped
+        memory; misses map the file once and evict the least recently used
+        entry beyond capacity.
+        """
+        mtime = os.stat(file_path).st_mtime
+        with self._paper_cache_lock:
+            cached = self._paper_cache.get(file_path)
+            if cached is not None:
+                cached_mtime, mapped = cached
+                if cached_mtime == mtime:
+                    self._paper_cache.move_to_end(file_path)
+                    # Copy inside the lock: a racing insert may evict and
+                    # close this mapping the moment we release it.
+                    data = bytes(mapped)
+                else:
+                    del self._paper_cache[file_path]
+                    mapped.close()
+                    cached = None
+        if cached is not None:
+            return data.decode("utf-8")
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size == 0:
+                return ""
+            mapped = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        with self._paper_cache_lock:
+            stale = self._paper_cache.pop(file_path, None)
+            if stale is not None:
+                stale[1].close()
+            self._paper_cache[file_path] = (mtime, mapped)
+            while len(self._paper_cache) > _PAPER_CACHE_CAPACITY:
+                _, (_, evicted) = self._paper_cache.popitem(last=False)
+                evicted.close()
+            data = bytes(mapped)
+        return data.decode("utf-8")
+
+    def _drop_cached_paper(self, file_path: str) -> None:
+        with self._paper_cache_lock:
+            cached = self._paper_cache.pop(file_path, None)
+        if cached is not None:
+            cached[1].close()
+
     def delete(self, paper_title: str, doi: str = "") -> bool:
         """
         Delete a scientific paper knowledge file or directory.
@@ -116,6 +188,13 @@ class MarkdownModule:
         """
         paper_dir = self._sanitize_name(paper_title)
         paper_path = os.path.join(self.root_path, paper_dir)
+        self._listing_mtime = 0.0
+        with self._paper_cache_lock:
+            doomed = [
+                p for p in self._paper_cache if p.startswith(paper_path + os.sep)
+            ]
+        for cached_path in doomed:
+            self._drop_cached_paper(cached_path)
         if doi:
             file_name = f"{self._sanitize_name(doi)}.md"
             file_path = os.path.join(paper_path, file_name)
@@ -146,11 +225,13 @@ class MarkdownModule:
             A list of paper titles (directory names)
         """
         try:
-            papers = [
-                d
-                for d in os.listdir(self.root_path)
-                if os.path.isdir(os.path.join(self.root_path, d))
-            ]
+            mtime = os.stat(self.root_path).st_mtime
+            if self._listing_cache is not None and mtime == self._listing_mtime:
+                return self._listing_cache
+            with os.scandir(self.root_path) as entries:
+                papers = [entry.name for entry in entries if entry.is_dir()]
+            self._listing_cache = papers
+            self._listing_mtime = mtime
             logger.info(f"Listed {len(papers)} scientific papers")
             return papers
         except Exception as e:
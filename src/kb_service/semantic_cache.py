@@ -0,0 +1,233 @@
+"""
+Semantic response cache for knowledge base queries.
+
+Identical or near-identical queries recur constantly in chat sessions, yet
+every one of them normally pays a full LightRAG retrieval plus LLM synthesis.
+This module short-circuits repeats: exact hits are answered from a hash
+lookup, near hits (cosine similarity above a threshold on query embeddings)
+reuse the stored response. Entries are persisted to SQLite under CACHE_DIR so
+the cache survives restarts, and a generation counter invalidates everything
+when new knowledge is saved.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from src.core.config import CACHE_DIR, OPENAI_API_KEY
+from src.core.logger import logger
+from src.core.query_norm import normalize as _normalize
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_TTL = 300.0  # seconds
+DEFAULT_MAXSIZE = 4096
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+
+class SemanticCache:
+    """
+    Two-tier response cache: exact hash lookup first, then embedding
+    cosine-similarity over cached queries.
+
+    The embedding tier is best-effort — it needs numpy and an OpenAI API key,
+    and silently degrades to exact-match-only when either is missing or the
+    embedding call fails.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        maxsize: int = DEFAULT_MAXSIZE,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entries = {}  # hash -> (ts, generation, response, embedding|None)
+        self._embedding_client = None
+        # Embeddings for newly stored entries are computed here, off the
+        # response path; one worker keeps the OpenAI client single-threaded.
+        self._embed_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="semcache-embed"
+        )
+        self._db_path = db_path or str(Path(CACHE_DIR) / "semcache.sqlite")
+        self._db = None
+        try:
+            self._db = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "hash TEXT PRIMARY KEY, ts REAL, generation INTEGER, "
+                "response TEXT, embedding BLOB)"
+            )
+            self._load()
+        except Exception as e:
+            logger.warning(f"Semantic cache persistence unavailable: {e}")
+            self._db = None
+
+    def _load(self):
+        for h, ts, gen, response, emb in self._db.execute(
+            "SELECT hash, ts, generation, response, embedding FROM entries"
+        ):
+            vector = None
+            if emb is not None and np is not None:
+                vector = np.frombuffer(emb, dtype=np.float32)
+            self._entries[h] = (ts, gen, response, vector)
+            self._generation = max(self._generation, gen)
+
+    def _embed(self, text: str):
+        if np is None or not OPENAI_API_KEY:
+            return None
+        try:
+            if self._embedding_client is None:
+                from openai import OpenAI
+
+                self._embedding_client = OpenAI()
+            data = self._embedding_client.embeddings.create(
+                model=EMBEDDING_MODEL, input=text
+            )
+            vector = np.asarray(data.data[0].embedding, dtype=np.float32)
+            return vector / np.linalg.norm(vector)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+    @staticmethod
+    def _hash(normalized: str) -> str:
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    def get(self, query: str) -> Optional[str]:
+        """Return a cached response for the query, or None on a miss."""
+        normalized = _normalize(query)
+        key = self._hash(normalized)
+        now = time.time()
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                ts, gen, response, _ = hit
+                if gen == self._generation and now - ts < self.ttl:
+                    logger.info("Semantic cache: exact hit")
+                    return response
+                del self._entries[key]
+        # Near-hit tier: cosine similarity of the query embedding against the
+        # (already normalized) cached vectors.
+        vector = self._embed(normalized)
+        if vector is None:
+            return None
+        with self._lock:
+            best, best_sim = None, self.threshold
+            for ts, gen, response, cached_vec in self._entries.values():
+                if cached_vec is None or gen != self._generation:
+                    continue
+                if now - ts >= self.ttl:
+                    continue
+                sim = float(vector @ cached_vec)
+                if sim > best_sim:
+                    best, best_sim = response, sim
+            if best is not None:
+                logger.info(f"Semantic cache: near hit (cosine={best_sim:.3f})")
+            return best
+
+    async def aget(self, query: str) -> Optional[str]:
+        """
+        Async counterpart of get for use on event loops: the near-hit tier
+        makes a blocking embedding round trip on exact misses, so run the
+        lookup on a worker thread instead of stalling the loop.
+        """
+        return await asyncio.to_thread(self.get, query)
+
+    def put(self, query: str, response: str):
+        """
+        Store a response under the normalized query.
+
+        Returns immediately: the entry is written embedding-less (serving
+        exact hits at once) and the embedding for the near-hit tier is
+        computed on the background worker, so neither sync nor async callers
+        pay an HTTP round trip on the response path.
+        """
+        normalized = _normalize(query)
+        key = self._hash(normalized)
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (now, self._generation, response, None)
+            self._evict_locked()
+            self._persist_locked(key, now, self._generation, response, None)
+        self._embed_executor.submit(self._attach_embedding, key, normalized)
+
+    def _attach_embedding(self, key: str, normalized: str):
+        """Embed a stored query and back-fill its entry (background worker)."""
+        vector = self._embed(normalized)
+        if vector is None:
+            return
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return  # evicted while embedding
+            ts, gen, response, _ = hit
+            self._entries[key] = (ts, gen, response, vector)
+            self._persist_locked(key, ts, gen, response, vector)
+
+    def _persist_locked(self, key, ts, gen, response, vector):
+        """Write one entry through to SQLite. Caller must hold the lock."""
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    ts,
+                    gen,
+                    response,
+                    vector.tobytes() if vector is not None else None,
+                ),
+            )
+            self._db.commit()
+        except Exception as e:
+            logger.warning(f"Semantic cache persist failed: {e}")
+
+    def _evict_locked(self):
+        """
+        Keep the table bounded: expired and stale-generation entries go
+        first, then the oldest live entries until we are under maxsize.
+        Caller must hold the lock.
+        """
+        if len(self._entries) <= self.maxsize:
+            return
+        now = time.time()
+        self._entries = {
+            h: entry
+            for h, entry in self._entries.items()
+            if entry[1] == self._generation and now - entry[0] < self.ttl
+        }
+        if len(self._entries) > self.maxsize:
+            oldest_first = sorted(self._entries.items(), key=lambda item: item[1][0])
+            for h, _ in oldest_first[: len(self._entries) - self.maxsize]:
+                del self._entries[h]
+
+    def invalidate(self):
+        """Bump the generation counter; call after knowledge is saved."""
+        with self._lock:
+            self._generation += 1
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM entries")
+                    self._db.commit()
+                except Exception:
+                    pass
+
+
+# Process-wide cache shared by the service and the agent tools.
+semantic_cache = SemanticCache()